@@ -0,0 +1,53 @@
+import streamlit as st
+import pandas as pd
+from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode
+
+# -------------------------------------------------------------------
+# Portfolio Result Helpers shared by the backtest pages
+# -------------------------------------------------------------------
+def store_portfolio_results(pf, prefix="pf"):
+    """
+    Compute the vectorbt portfolio views once and keep them in session state under `{prefix}_*`,
+    so each page can hold its own portfolio without overwriting the other's
+    """
+    stats_df = pf.stats().to_frame(name='Value')
+    # Timedelta values don't serialize to Arrow, render the whole column as strings
+    stats_df["Value"] = stats_df["Value"].astype(str)
+    trade_history = pf.trade_history
+    trades_df = pf.trades.records_readable.sort_values(by="PnL", ascending=False).reset_index(drop=True)
+
+    st.session_state[f"{prefix}_stats"] = stats_df
+    st.session_state[f"{prefix}_value"] = pf.value
+    st.session_state[f"{prefix}_cum"] = pf.cumulative_returns
+    st.session_state[f"{prefix}_returns"] = pf.returns
+    st.session_state[f"{prefix}_trade_history"] = trade_history
+    st.session_state[f"{prefix}_trades_df"] = trades_df
+    st.session_state[f"{prefix}_trade_history_grid"] = records_grid_options(trade_history)
+    st.session_state[f"{prefix}_trades_grid"] = records_grid_options(trades_df)
+
+def records_grid_options(df):
+    """Paginated, filterable AgGrid options so long trade lists aren't shipped to the browser whole"""
+    gb = GridOptionsBuilder.from_dataframe(df)
+    gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=100)
+    gb.configure_default_column(filter=True, sortable=True)
+    return gb.build()
+
+def show_records_grid(df, grid_options, key):
+    # Read-only view, sorting and filtering stay in the browser instead of rerunning the script
+    AgGrid(df, gridOptions=grid_options, update_mode=GridUpdateMode.NO_UPDATE, theme="streamlit", height=400, key=key)
+
+def backtest_summary_frame(params):
+    """Saved backtest metadata as a single Field/Value table"""
+    return pd.DataFrame([
+        ("Strategy Name", params['strategy_name']),
+        ("Market Name", params['market_name']),
+        ("Timeframe", params['timeframe']),
+        ("Symbols", ', '.join(params['symbol_list'])),
+        ("Trading Pair", params['pair']),
+        ("Start Date", params['start_date']),
+        ("End Date", params['end_date']),
+        ("Initial Cash", f"${params['init_cash']:,.2f}"),
+        ("Trading Fees", f"{params['fees'] * 100:.4f}%"),
+        ("Slippage", f"{params['slippage'] * 100:.4f}%"),
+        ("Allow Partial Orders", str(params['allow_partial'])),
+    ], columns=["Field", "Value"]).set_index("Field")
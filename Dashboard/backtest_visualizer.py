@@ -1,15 +1,46 @@
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 from backtest_engine.backtester import Backtester
 from urllib.parse import urlencode
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode
 from finstore.finstore import Finstore
+from Dashboard.backtest_results import store_portfolio_results, backtest_summary_frame
+
+# Candlestick traces render in SVG, thin out longer trade windows to keep the chart responsive
+MAX_CHART_BARS = 5000
 
 @st.cache_resource
 def get_finstore(market_name, timeframe, pair=''):
     return Finstore(market_name=market_name, timeframe=timeframe, pair=pair)
 
+@st.cache_data(show_spinner=False)
+def load_ohlcv(market_name, timeframe, pair, symbol):
+    """OHLCV for one symbol with timestamps parsed and sorted once, callers get their own copy"""
+    _, ohlcv_data = get_finstore(market_name, timeframe, pair=pair).read.symbol(symbol)
+    ohlcv_data["timestamp"] = pd.to_datetime(ohlcv_data["timestamp"])
+    return ohlcv_data.sort_values("timestamp", ignore_index=True)
+
+@st.fragment
+def show_backtest_summary(backtests):
+    """Backtest selector and summary, reruns on its own when the selection changes"""
+    selected_backtest = st.selectbox("Select a backtest to view:", list(backtests.keys()), key="viz_selected_backtest")
+    if selected_backtest:
+        params = backtests[selected_backtest]
+        col1, col2 = st.columns(2)
+        with col1:
+            st.table(backtest_summary_frame(params))
+        with col2:
+            st.write("**Strategy Parameters:**")
+            st.json(params["strategy_params"])
+
+        st.subheader("📊 Performance Metrics")
+        col1, col2, col3 = st.columns(3)
+        col1.metric(label="📈 Returns", value=f"{params['performance']['returns']:.2%}")
+        col2.metric(label="📈 Sharpe Ratio", value=f"{params['performance']['sharpe_ratio']:.2f}")
+        col3.metric(label="📉 Max Drawdown", value=f"{params['performance']['max_drawdown']:.2%}")
+
 # 🔄 Load Previously Backtested Portfolio
 with st.expander("📂 Load Previous Backtest", expanded=True):
     with st.spinner("Loading backtests..."):
@@ -18,67 +49,43 @@ with st.expander("📂 Load Previous Backtest", expanded=True):
             st.info("No saved backtests found. Run and save a backtest first.")
             st.stop()
         else:
-            selected_backtest = st.selectbox("Select a backtest to view:", list(backtests.keys()))
-            if selected_backtest:
-                params = backtests[selected_backtest]
-                st.session_state.params = params  # store for later use
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write(f"**Strategy Name:** {params['strategy_name']}")
-                    st.write(f"**Market Name:** {params['market_name']}")
-                    st.write(f"**Timeframe:** {params['timeframe']}")
-                    st.write(f"**Symbols:** {', '.join(params['symbol_list'])}")
-                    st.write(f"**Trading Pair:** {params['pair']}")
-                    st.write(f"**Start Date:** {params['start_date']}")
-                    st.write(f"**End Date:** {params['end_date']}")
-                with col2:
-                    st.write(f"**Initial Cash:** ${params['init_cash']:,.2f}")
-                    st.write(f"**Trading Fees:** {params['fees'] * 100:.4f}%")
-                    st.write(f"**Slippage:** {params['slippage'] * 100:.4f}%")
-                    st.write(f"**Allow Partial Orders:** {params['allow_partial']}")
-                    st.write("**Strategy Parameters:**")
-                    st.json(params["strategy_params"])
-
-                st.subheader("📊 Performance Metrics")
-                col1, col2, col3 = st.columns(3)
-                col1.metric(label="📈 Returns", value=f"{params['performance']['returns']:.2%}")
-                col2.metric(label="📈 Sharpe Ratio", value=f"{params['performance']['sharpe_ratio']:.2f}")
-                col3.metric(label="📉 Max Drawdown", value=f"{params['performance']['max_drawdown']:.2%}")
-                
-                if st.button("🔍 Load Portfolio & Stats"):
-                    with st.spinner("Loading backtest..."):
-                        pf, _ = Backtester.load_backtest(selected_backtest)
-                    st.session_state.pf = pf
-                    st.session_state.trades_df = pf.trades.records_readable.sort_values(by="PnL", ascending=False).reset_index(drop=True)
-                    st.success(f"Successfully loaded backtest: {selected_backtest}")
+            show_backtest_summary(backtests)
+            
+            if st.button("🔍 Load Portfolio & Stats"):
+                selected_backtest = st.session_state.viz_selected_backtest
+                with st.spinner("Loading backtest..."):
+                    pf, _ = Backtester.load_backtest(selected_backtest)
+                st.session_state.pf = pf
+                st.session_state.params = backtests[selected_backtest]  # store for later use
+                store_portfolio_results(pf, prefix="loaded_pf")
+                st.success(f"Successfully loaded backtest: {selected_backtest}")
 
 # Continue only if portfolio is loaded
 if "pf" in st.session_state:
-    pf = st.session_state.pf
-    trades_df = st.session_state.trades_df
+    trades_df = st.session_state.loaded_pf_trades_df
+    pf_value = st.session_state.loaded_pf_value
+    pf_cum = st.session_state.loaded_pf_cum
 
     st.subheader("📊 Portfolio Statistics")
-    stats_df = pf.stats().to_frame(name="Value")
-    stats_df["Value"] = stats_df["Value"].apply(lambda x: str(x) if isinstance(x, pd.Timedelta) else x)
-    st.dataframe(stats_df)
+    st.dataframe(st.session_state.loaded_pf_stats)
 
     st.subheader("📈 Equity (PNL) Curve")
     fig_pnl = go.Figure()
-    fig_pnl.add_trace(go.Scatter(x=pf.value.index, y=pf.value, mode='lines', name="Portfolio Value"))
+    fig_pnl.add_trace(go.Scattergl(x=pf_value.index, y=pf_value, mode='lines', name="Portfolio Value"))
     fig_pnl.update_layout(
         yaxis_title="Portfolio Value",
         title="Equity Curve",
-        yaxis_type="log" if pf.value.max() > 10000 else "linear"
+        yaxis_type="log" if pf_value.max() > 10000 else "linear"
     )
     st.plotly_chart(fig_pnl)
 
     st.subheader("📈 Cumulative Returns")
     fig_cum = go.Figure()
-    fig_cum.add_trace(go.Scatter(x=pf.cumulative_returns.index, y=pf.cumulative_returns, mode='lines', name="Cumulative Returns"))
+    fig_cum.add_trace(go.Scattergl(x=pf_cum.index, y=pf_cum, mode='lines', name="Cumulative Returns"))
     fig_cum.update_layout(
         yaxis_title="Cumulative Returns",
         title="Cumulative Returns Curve",
-        yaxis_type="log" if pf.cumulative_returns.max() > 10 else "linear"
+        yaxis_type="log" if pf_cum.max() > 10 else "linear"
     )
     st.plotly_chart(fig_cum)
 
@@ -113,8 +120,7 @@ if "pf" in st.session_state:
 
             # Fetch OHLCV data for the traded pair using the timeframe from params.
             timeframe = st.session_state.params['timeframe']
-            _, ohlcv_data = get_finstore("crypto_binance", timeframe, pair="BTC").read.symbol(trade_pair)
-            ohlcv_data["timestamp"] = pd.to_datetime(ohlcv_data["timestamp"])
+            ohlcv_data = load_ohlcv("crypto_binance", timeframe, "BTC", trade_pair)
 
             # Calculate ATR on the full OHLCV data with a rolling window of 14
             ohlcv_data['prev_close'] = ohlcv_data['close'].shift(1)
@@ -138,48 +144,57 @@ if "pf" in st.session_state:
             }
             buffer = timeframe_mapping.get(timeframe, pd.Timedelta(days=5))
 
-            filtered_data = ohlcv_data[
-                (ohlcv_data["timestamp"] >= entry_timestamp - buffer) &
-                (ohlcv_data["timestamp"] <= exit_timestamp + buffer)
-            ].copy()
+            # Timestamps are sorted, so slice the trade window by position instead of masking every row
+            timestamps = ohlcv_data["timestamp"].values
+            lo = np.searchsorted(timestamps, (entry_timestamp - buffer).to_datetime64(), side="left")
+            hi = np.searchsorted(timestamps, (exit_timestamp + buffer).to_datetime64(), side="right")
+            filtered_data = ohlcv_data.iloc[lo:hi].copy()
+            window_timestamps = timestamps[lo:hi]
 
             # Calculate dynamic ATR bands for every data point based on the close price
             filtered_data["upper_band"] = filtered_data["close"] + 3 * filtered_data["atr"]
             filtered_data["lower_band"] = filtered_data["close"] - 1.5 * filtered_data["atr"]
 
+            step = max(1, len(filtered_data) // MAX_CHART_BARS)
+            plot_data = filtered_data.iloc[::step]
+
             fig_trade = go.Figure()
 
             # Plot candlestick chart
             fig_trade.add_trace(go.Candlestick(
-                x=filtered_data["timestamp"],
-                open=filtered_data["open"],
-                high=filtered_data["high"],
-                low=filtered_data["low"],
-                close=filtered_data["close"],
+                x=plot_data["timestamp"],
+                open=plot_data["open"],
+                high=plot_data["high"],
+                low=plot_data["low"],
+                close=plot_data["close"],
                 name="Price"
             ))
 
             # Plot dynamic ATR bands following the price action
             fig_trade.add_trace(go.Scatter(
-                x=filtered_data["timestamp"],
-                y=filtered_data["upper_band"],
+                x=plot_data["timestamp"],
+                y=plot_data["upper_band"],
                 mode="lines",
                 line=dict(color="green", width=2),
                 name="Upper ATR Band (Close + 3*ATR)"
             ))
             fig_trade.add_trace(go.Scatter(
-                x=filtered_data["timestamp"],
-                y=filtered_data["lower_band"],
+                x=plot_data["timestamp"],
+                y=plot_data["lower_band"],
                 mode="lines",
                 line=dict(color="red", width=2),
                 name="Lower ATR Band (Close - 1.5*ATR)"
             ))
 
             # Determine entry and exit prices for markers
-            entry_price_series = filtered_data.loc[filtered_data["timestamp"] == entry_timestamp, "close"]
-            entry_price = entry_price_series.values[0] if not entry_price_series.empty else filtered_data.iloc[0]["close"]
-            exit_price_series = filtered_data.loc[filtered_data["timestamp"] == exit_timestamp, "close"]
-            exit_price = exit_price_series.values[0] if not exit_price_series.empty else filtered_data.iloc[-1]["close"]
+            def price_at(timestamp, fallback_position):
+                position = np.searchsorted(window_timestamps, timestamp.to_datetime64(), side="left")
+                if position < len(window_timestamps) and window_timestamps[position] == timestamp.to_datetime64():
+                    return filtered_data["close"].iloc[position]
+                return filtered_data["close"].iloc[fallback_position]
+
+            entry_price = price_at(entry_timestamp, 0)
+            exit_price = price_at(exit_timestamp, -1)
 
             fig_trade.add_trace(go.Scatter(
                 x=[entry_timestamp],
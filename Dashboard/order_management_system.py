@@ -124,9 +124,9 @@ def order_entry(binance_oms, market_type):
 def position_management(binance_oms):
     with st.expander("📊 Position Management"):
         if st.button("🔄 Refresh Positions"):
-            positions = binance_oms.view_open_futures_positions()
+            positions = binance_oms.view_open_futures_positions(formatted=False)
             if not positions.empty:
-                st.dataframe(positions.style.highlight_max(axis=0), use_container_width=True)
+                st.dataframe(binance_oms.style_positions(positions).highlight_max(axis=0, subset=positions.select_dtypes('number').columns), use_container_width=True)
             else:
                 st.info("No open positions")
         
@@ -184,9 +184,9 @@ def account_info(binance_oms, market_type):
         with col2:
             if st.button("Show Positions"):
                 if market_type == "Futures":
-                    positions = binance_oms.view_open_futures_positions()
+                    positions = binance_oms.view_open_futures_positions(formatted=False)
                     if not positions.empty:
-                        st.dataframe(positions.style.highlight_max(axis=0), use_container_width=True)
+                        st.dataframe(binance_oms.style_positions(positions).highlight_max(axis=0, subset=positions.select_dtypes('number').columns), use_container_width=True)
                     else:
                         st.info("No open futures positions")
                 else:
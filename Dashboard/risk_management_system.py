@@ -57,21 +57,17 @@ def calculate_portfolio_metrics(exchanges):
             total_balance += futures_balance['total']
             broker_balances['Binance'] = futures_balance['total']
             
-            binance_positions = binance.view_open_futures_positions()
+            binance_positions = binance.view_open_futures_positions(formatted=False)
             if not binance_positions.empty:
                 for _, row in binance_positions.iterrows():
-                    mark_price = float(row['Mark Price'].replace('$', '').replace(',', ''))
-                    entry_price = float(row['Entry Price'].replace('$', '').replace(',', ''))
-                    size_usd = float(row['Size (USD)'].replace('$', '').replace(',', ''))
-                    
                     positions.append({
                         'Exchange': 'Binance',
                         'Symbol': row['Symbol'],
-                        'Size (USD)': size_usd,
-                        'Entry Price': entry_price,
-                        'Mark Price': mark_price,
-                        'PnL (USD)': float(row['PNL (Unrealized)'].replace('$', '').replace(',', '')),
-                        'Leverage': row['Leverage']
+                        'Size (USD)': row['Size (USD)'],
+                        'Entry Price': row['Entry Price'],
+                        'Mark Price': row['Mark Price'],
+                        'PnL (USD)': row['PNL (Unrealized)'],
+                        'Leverage': f"{row['Leverage']}x"
                     })
         except Exception as e:
             st.error(f"Binance data error: {str(e)}")
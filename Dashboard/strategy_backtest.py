@@ -5,14 +5,15 @@
 import streamlit as st
 import pandas as pd
 import inspect
+import functools
+from itertools import chain
 import datetime
 from datetime import date
 import pickle
-import time
 from finstore.finstore import Finstore
-from strategy.public.ema_strategy import get_ema_signals_wrapper
 from strategy.strategy_registry import STRATEGY_REGISTRY
 import plotly.graph_objects as go
+from Dashboard.backtest_results import store_portfolio_results, show_records_grid, backtest_summary_frame
 import numpy as np
 import os
 from urllib.parse import urlencode
@@ -38,9 +39,15 @@ def get_finstore_indian_equity(timeframe='1d'):
 def get_finstore(market_name, timeframe, pair=''):
     return Finstore(market_name=market_name, timeframe=timeframe, pair=pair)
 
+@st.cache_data(ttl=3600, max_entries=4, show_spinner=False)
+def load_ohlcv_data(market_name, timeframe, pair, symbols):
+    """Read OHLCV data for a symbol set once per (market, timeframe, pair, symbols)"""
+    return get_finstore(market_name, timeframe, pair=pair).read.symbol_list(list(symbols))
+
 # -------------------------------------------------------------------
 # Dummy Strategy Functions for Demonstration
 # -------------------------------------------------------------------
+@st.cache_resource
 def list_strategy_modules():
     """Return available strategy modules with their parameters"""
     strategy_dict = {}
@@ -50,6 +57,14 @@ def list_strategy_modules():
     return strategy_dict
 
 
+@functools.lru_cache(maxsize=None)
+def _strategy_params(strategy_class):
+    """(name, annotation, default) of a strategy's constructor parameters, reflected once per class"""
+    sig = inspect.signature(strategy_class.__init__)
+    # Skip `self`
+    return tuple((p.name, p.annotation, p.default) for p in list(sig.parameters.values())[1:])
+
+
 def dummy_rsi_strategy(ohlcv_data, symbol_list, rsi_period=14, oversold=30, overbought=70):
     return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
@@ -59,6 +74,27 @@ def dummy_macd_strategy(ohlcv_data, symbol_list, fast=12, slow=26, signal=9):
 # -------------------------------------------------------------------
 # Asset Selection Helpers
 # -------------------------------------------------------------------
+@functools.lru_cache(maxsize=16)
+def _lower_index(symbols: tuple) -> tuple:
+    """Lowercased copy of a symbol universe, built once per universe"""
+    return tuple(s.lower() for s in symbols)
+
+def filter_symbols(symbols, search_query):
+    """Case-insensitive substring filter over a symbol universe"""
+    if not search_query:
+        return list(symbols)
+    symbols = tuple(symbols)
+    query = search_query.lower()
+    return [s for s, lower in zip(symbols, _lower_index(symbols)) if query in lower]
+
+def selected_in(filtered):
+    """Selected symbols within `filtered`, kept in `filtered` order so the multiselect stays stable"""
+    selected = st.session_state.selected_symbols
+    if not selected:
+        return []
+    return [s for s in filtered if s in selected]
+
+@st.fragment
 def handle_crypto_selection(crypto_data):
     """Clean crypto selection with pair type filtering and search"""
     col1, col2 = st.columns([1, 3])
@@ -72,28 +108,31 @@ def handle_crypto_selection(crypto_data):
         )
         
     with col2:
-        symbols = crypto_data.get(f"{pair_type} Pairs", [])
+        symbols = crypto_data.get(f"{pair_type} Pairs", ())
         search_query = st.text_input("Search crypto pairs:", key="crypto_search")
-        filtered = [s for s in symbols if search_query.lower() in s.lower()]
+        filtered = filter_symbols(symbols, search_query)
+        changed = False
         
         # Batch operations
         col1, col2 = st.columns(2)
         with col1:
             if st.button(f"Add all {pair_type} pairs", help="Add all filtered pairs"):
-                add_symbols(filtered)
+                changed = add_symbols(filtered)
         with col2:
             if st.button(f"Clear {pair_type} selection", help="Remove all pairs of this type"):
-                remove_symbols(filtered)
+                changed = remove_symbols(filtered)
         
         # Symbol selection
         selected = st.multiselect(
             "Available pairs:",
             options=filtered,
-            default=[s for s in filtered if s in st.session_state.selected_symbols],
+            default=selected_in(filtered),
             label_visibility="collapsed"
         )
-        update_selection(selected, filtered)
+        changed = update_selection(selected, filtered) or changed
+        rerun_if_changed(changed)
 
+@st.fragment
 def handle_equity_selection(indian_data, us_data):
     """Equity market selection with country grouping"""
     country = st.radio(
@@ -103,57 +142,63 @@ def handle_equity_selection(indian_data, us_data):
     )
     
     symbols = indian_data.get('NSE Equity', []) if country == "India" \
-        else us_data.get('NASDAQ', []) + us_data.get('NYSE', [])
+        else chain(us_data.get('NASDAQ', ()), us_data.get('NYSE', ()))
     
     search_query = st.text_input(f"Search {country} equities:", key=f"equity_search_{country}")
-    filtered = [s for s in symbols if search_query.lower() in s.lower()]
+    filtered = filter_symbols(symbols, search_query)
+    changed = False
     
     # Batch operations
     col1, col2 = st.columns(2)
     with col1:
         if st.button(f"Select all {country}"):
-            add_symbols(filtered)
+            changed = add_symbols(filtered)
     with col2:
         if st.button(f"Clear {country}"):
-            remove_symbols(filtered)
+            changed = remove_symbols(filtered)
     
     # Symbol selection
     selected = st.multiselect(
         f"Select {country} equities:",
         options=filtered,
-        default=[s for s in filtered if s in st.session_state.selected_symbols],
+        default=selected_in(filtered),
         label_visibility="collapsed"
     )
-    update_selection(selected, filtered)
+    changed = update_selection(selected, filtered) or changed
+    rerun_if_changed(changed)
 
+@st.fragment
 def handle_other_selection(commodities_data):
     """Commodities and other markets selection"""
     search_query = st.text_input("Search commodities:", key="comm_search")
-    symbols = commodities_data.get('Metals', []) + commodities_data.get('Energy', [])
-    filtered = [s for s in symbols if search_query.lower() in s.lower()]
+    symbols = chain(commodities_data.get('Metals', ()), commodities_data.get('Energy', ()))
+    filtered = filter_symbols(symbols, search_query)
+    changed = False
     
     # Batch operations
     col1, col2 = st.columns(2)
     with col1:
         if st.button("Select all commodities"):
-            add_symbols(filtered)
+            changed = add_symbols(filtered)
     with col2:
         if st.button("Clear commodities"):
-            remove_symbols(filtered)
+            changed = remove_symbols(filtered)
     
     # Symbol selection
     selected = st.multiselect(
         "Select commodities:",
         options=filtered,
-        default=[s for s in filtered if s in st.session_state.selected_symbols],
+        default=selected_in(filtered),
         label_visibility="collapsed"
     )
-    update_selection(selected, filtered)
+    changed = update_selection(selected, filtered) or changed
+    rerun_if_changed(changed)
 
 
 # -------------------------------------------------------------------
 # Enhanced Asset Selection Components
 # -------------------------------------------------------------------
+@st.fragment
 def crypto_selection_widget(crypto_data):
     st.subheader("💰 Crypto Asset Selection")
     col1, col2 = st.columns([1, 3])
@@ -162,79 +207,88 @@ def crypto_selection_widget(crypto_data):
         pair_type = st.radio("Pair Type:", ["USDT", "BTC"], horizontal=True)
     
     with col2:
-        symbols = crypto_data.get(f"{pair_type} Pairs", [])
+        symbols = crypto_data.get(f"{pair_type} Pairs", ())
         search_query = st.text_input("Search pairs:", key=f"crypto_search_{pair_type}")
-        filtered = [s for s in symbols if search_query.lower() in s.lower()]
+        filtered = filter_symbols(symbols, search_query)
+        changed = False
         
         col_a, col_b = st.columns(2)
         with col_a:
             if st.button(f"Add all {pair_type}", help="Add all filtered pairs"):
-                add_symbols(filtered)
+                changed = add_symbols(filtered)
         with col_b:
             if st.button(f"Clear {pair_type}", help="Clear current selection"):
-                remove_symbols(filtered)
+                changed = remove_symbols(filtered)
         
         # Virtualized selection
         container = st.container()
         selected = container.multiselect(
             f"Select {pair_type} pairs:",
             options=filtered,
-            default=[s for s in filtered if s in st.session_state.selected_symbols],
+            default=selected_in(filtered),
             label_visibility="collapsed"
         )
-        update_selection(selected, filtered)
+        changed = update_selection(selected, filtered) or changed
+        rerun_if_changed(changed)
 
+@st.fragment
 def equity_selection_widget(indian_data, us_data):
     st.subheader("📈 Equity Selection")
     country = st.radio("Market Region:", ["India", "US"], horizontal=True)
     
     symbols = indian_data.get('NSE Equity', []) if country == "India" \
-        else us_data.get('NASDAQ', []) + us_data.get('NYSE', [])
+        else chain(us_data.get('NASDAQ', ()), us_data.get('NYSE', ()))
     
     search_query = st.text_input(f"Search {country} equities:", key=f"equity_search_{country}")
-    filtered = [s for s in symbols if search_query.lower() in s.lower()]
+    filtered = filter_symbols(symbols, search_query)
+    changed = False
     
     col1, col2 = st.columns(2)
     with col1:
         if st.button(f"Add all {country}"):
-            add_symbols(filtered)
+            changed = add_symbols(filtered)
     with col2:
         if st.button(f"Clear {country}"):
-            remove_symbols(filtered)
+            changed = remove_symbols(filtered)
     
     container = st.container()
     selected = container.multiselect(
         f"Select {country} equities:",
         options=filtered,
-        default=[s for s in filtered if s in st.session_state.selected_symbols],
+        default=selected_in(filtered),
         label_visibility="collapsed"
     )
-    update_selection(selected, filtered)
+    changed = update_selection(selected, filtered) or changed
+    rerun_if_changed(changed)
 
+@st.fragment
 def commodity_selection_widget(commodities_data):
     st.subheader("🛢️ Commodity Selection")
     search_query = st.text_input("Search commodities:", key="comm_search")
-    symbols = commodities_data.get('Metals', []) + commodities_data.get('Energy', [])
-    filtered = [s for s in symbols if search_query.lower() in s.lower()]
+    symbols = chain(commodities_data.get('Metals', ()), commodities_data.get('Energy', ()))
+    filtered = filter_symbols(symbols, search_query)
+    changed = False
     
     col1, col2 = st.columns(2)
     with col1:
         if st.button("Add all commodities"):
-            add_symbols(filtered)
+            changed = add_symbols(filtered)
     with col2:
         if st.button("Clear commodities"):
-            remove_symbols(filtered)
+            changed = remove_symbols(filtered)
     
     container = st.container()
     selected = container.multiselect(
         "Select commodities:",
         options=filtered,
-        default=[s for s in filtered if s in st.session_state.selected_symbols],
+        default=selected_in(filtered),
         label_visibility="collapsed"
     )
-    update_selection(selected, filtered)
+    changed = update_selection(selected, filtered) or changed
+    rerun_if_changed(changed)
 
 
+@st.fragment
 def display_selected_symbols():
     """Clean display of selected symbols"""
     selected = st.session_state.selected_symbols
@@ -242,66 +296,99 @@ def display_selected_symbols():
     
     if selected:
         # Show first 3 symbols + count of remaining
-        display_text = ", ".join(selected[:3])
+        display_text = ", ".join(sorted(selected)[:3])
         if len(selected) > 3:
             display_text += f" (+{len(selected)-3} more)"
         st.caption(display_text)
         
         if st.button("Clear all selections", type="primary"):
-            st.session_state.selected_symbols = []
+            st.session_state.selected_symbols = set()
+            st.rerun()
+
+def rerun_if_changed(changed):
+    """
+    The selection widgets are fragments, their own reruns don't refresh the rest of the page.
+    Rerun the whole app only when the selection actually changed so the summary stays current.
+    """
+    if changed:
+        st.rerun()
 
 def add_symbols(symbols):
-    st.session_state.selected_symbols = list(set(st.session_state.selected_symbols + symbols))
+    """Add `symbols` to the selection, returns True if anything was added"""
+    added = set(symbols) - st.session_state.selected_symbols
+    st.session_state.selected_symbols |= added
+    return bool(added)
 
 def remove_symbols(symbols):
-    st.session_state.selected_symbols = [s for s in st.session_state.selected_symbols if s not in symbols]
+    """Remove `symbols` from the selection, returns True if anything was removed"""
+    removed = st.session_state.selected_symbols & set(symbols)
+    st.session_state.selected_symbols -= removed
+    return bool(removed)
 
 def update_selection(selected, full_list):
-    """Handle multiselect updates"""
-    for symbol in selected:
-        if symbol not in st.session_state.selected_symbols:
-            st.session_state.selected_symbols.append(symbol)
-    for symbol in full_list:
-        if symbol not in selected and symbol in st.session_state.selected_symbols:
-            st.session_state.selected_symbols.remove(symbol)
+    """Handle multiselect updates, returns True if the selection changed"""
+    selected = set(selected)
+    added = selected - st.session_state.selected_symbols
+    removed = (set(full_list) - selected) & st.session_state.selected_symbols
+    st.session_state.selected_symbols |= added
+    st.session_state.selected_symbols -= removed
+    return bool(added or removed)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _symbol_list(market_name, timeframe, pair):
+    """Symbol universe of one store, a failed read raises so it isn't cached"""
+    return tuple(get_finstore(market_name, timeframe, pair=pair).read.get_symbol_list())
 
 def get_available_assets(timeframe=None):
     """Return hierarchical market structure with nested universes"""
     asset_groups = {}
     if not timeframe:
-        return {'Please select timeframe first': []}
+        return {'Please select timeframe first': ()}
 
     try:
         # Get crypto pairs
-        btc_pairs = get_finstore("crypto_binance", timeframe, pair="BTC").read.get_symbol_list()
-        usdt_pairs = get_finstore("crypto_binance", timeframe, pair="USDT").read.get_symbol_list()
+        btc_pairs = _symbol_list("crypto_binance", timeframe, "BTC")
+        usdt_pairs = _symbol_list("crypto_binance", timeframe, "USDT")
         asset_groups['Crypto'] = {
-            'BTC Pairs': list(btc_pairs) if len(btc_pairs) > 0 else ['No BTC pairs'],
-            'USDT Pairs': list(usdt_pairs) if len(usdt_pairs) > 0 else ['No USDT pairs']
+            'BTC Pairs': btc_pairs if len(btc_pairs) > 0 else ('No BTC pairs',),
+            'USDT Pairs': usdt_pairs if len(usdt_pairs) > 0 else ('No USDT pairs',)
         }
     except Exception as e:
-        asset_groups['Crypto'] = {'Error': [f'Failed to load crypto data: {str(e)}']}
+        asset_groups['Crypto'] = {'Error': (f'Failed to load crypto data: {str(e)}',)}
 
     try:
-        nse_eq = get_finstore("indian_equity", timeframe, pair="").read.get_symbol_list()
+        nse_eq = _symbol_list("indian_equity", timeframe, "")
         asset_groups['Indian Market'] = {
-            'NSE Equity': list(nse_eq) if len(nse_eq) > 0 else ['No NSE equities']
+            'NSE Equity': nse_eq if len(nse_eq) > 0 else ('No NSE equities',)
         }
     except Exception as e:
-        asset_groups['Indian Market'] = {'Error': [f'Failed to load Indian data: {str(e)}']}
+        asset_groups['Indian Market'] = {'Error': (f'Failed to load Indian data: {str(e)}',)}
 
     asset_groups.update({
         'US Market': {
-            'NASDAQ': ['AAPL', 'TSLA', 'GOOG'],
-            'NYSE': ['IBM', 'BA']
+            'NASDAQ': ('AAPL', 'TSLA', 'GOOG'),
+            'NYSE': ('IBM', 'BA')
         },
         'Commodities': {
-            'Metals': ['GOLD', 'SILVER'],
-            'Energy': ['OIL', 'NATURALGAS']
+            'Metals': ('GOLD', 'SILVER'),
+            'Energy': ('OIL', 'NATURALGAS')
         }
     })
     return asset_groups
 # -------------------------------------------------------------------
+# Strategy Parameter Helpers
+# -------------------------------------------------------------------
+def strategy_param_key(module_name, param_name):
+    return f"sp_{module_name}_{param_name}"
+
+def strategy_params_from_state(module_name, strategy_class):
+    """Constructor kwargs for `strategy_class` from its parameter widgets"""
+    return {
+        name: st.session_state[strategy_param_key(module_name, name)]
+        for name, _, _ in _strategy_params(strategy_class)
+    }
+
+# -------------------------------------------------------------------
 # Strategy Backtester Page
 # -------------------------------------------------------------------
 def show_backtester_page():
@@ -310,7 +397,7 @@ def show_backtester_page():
     
     # Initialize session state for selected symbols
     if 'selected_symbols' not in st.session_state:
-        st.session_state.selected_symbols = []
+        st.session_state.selected_symbols = set()
     
     if "backtester_instance" not in st.session_state:
         st.session_state.backtester_instance = None
@@ -357,28 +444,29 @@ def show_backtester_page():
     # 4. Strategy Parameters
     with st.expander("⚙️ Strategy Parameters", expanded=True):
         strategy_func = strategy_modules[selected_module]
-        sig = inspect.signature(strategy_func.__init__)
-        params = {}
-        # Skip the first two parameters (ohlcv_data and symbol_list)
-        for param in list(sig.parameters.values())[1:]:
-            if param.annotation == int:
-                val = st.number_input(
-                    param.name,
-                    value=param.default if param.default != inspect.Parameter.empty else 0,
-                    step=1
+        for param_name, annotation, default in _strategy_params(strategy_func):
+            # Stable keys keep each value in session state, read back with strategy_params_from_state
+            key = strategy_param_key(selected_module, param_name)
+            if annotation == int:
+                st.number_input(
+                    param_name,
+                    value=default if default != inspect.Parameter.empty else 0,
+                    step=1,
+                    key=key
                 )
-            elif param.annotation == float:
-                val = st.number_input(
-                    param.name,
-                    value=param.default if param.default != inspect.Parameter.empty else 0.0,
-                    step=0.000001
+            elif annotation == float:
+                st.number_input(
+                    param_name,
+                    value=default if default != inspect.Parameter.empty else 0.0,
+                    step=0.000001,
+                    key=key
                 )
             else:
-                val = st.text_input(
-                    param.name,
-                    value=str(param.default) if param.default != inspect.Parameter.empty else ""
+                st.text_input(
+                    param_name,
+                    value=str(default) if default != inspect.Parameter.empty else "",
+                    key=key
                 )
-            params[param.name] = val
     
     st.markdown("---")
     # 5. Backtest Configuration
@@ -406,6 +494,10 @@ def show_backtester_page():
             index=0
         )
         cash_sharing = True if cash_sharing_str == "True" else False
+        use_float32 = st.checkbox(
+            "Use float32 (faster, lower precision)",
+            value=len(st.session_state.selected_symbols) >= 100
+        )
 
     # 6. Run Backtest
     if st.button("🚀 Run Backtest", use_container_width=True):
@@ -428,11 +520,13 @@ def show_backtester_page():
             from backtest_engine.backtester import Backtester
             update_progress(10, "📂 Loading market data...")
             
-            strategy_instance = strategy_func(**params)
+            strategy_instance = strategy_func(**strategy_params_from_state(selected_module, strategy_func))
+            symbol_list = sorted(st.session_state.selected_symbols)
+            ohlcv_data = load_ohlcv_data('crypto_binance', timeframe, 'BTC', tuple(symbol_list))
             
             backtester = Backtester(
                 market_name='crypto_binance',
-                symbol_list=st.session_state.selected_symbols,
+                symbol_list=symbol_list,
                 timeframe=timeframe,
                 strategy_object=strategy_instance,
                 strategy_type='multi',
@@ -445,10 +539,13 @@ def show_backtester_page():
                 cash_sharing=cash_sharing,
                 allow_partial=allow_partial,
                 progress_callback=update_progress,
-                pair='BTC'
+                pair='BTC',
+                ohlcv_data=ohlcv_data,
+                use_float32=use_float32
             )
             
             pf = backtester.portfolio
+            store_portfolio_results(pf)
             
             update_progress(100, "✅ Backtest completed successfully!")
             
@@ -462,91 +559,86 @@ def show_backtester_page():
             import traceback
             print(traceback.print_exc())
             print(e)
+        else:
+            # Only render after a successful run, a failed one must not show the previous run's results
+            with st.spinner("Loading Backtest statistics..."):
+                pf_value = st.session_state.pf_value
+                pf_cum = st.session_state.pf_cum
+
+                st.subheader("📊 Detailed Portfolio Statistics")
+                st.dataframe(st.session_state.pf_stats)
+
+                # --- Equity (PNL) Curve ---
+                st.subheader("📈 Equity (PNL) Curve")
+                fig_pnl = go.Figure()
+                fig_pnl.add_trace(go.Scattergl(
+                    x=pf_value.index, 
+                    y=pf_value,
+                    mode='lines',
+                    name="Portfolio Value"
+                ))
+                fig_pnl.update_layout(
+                    yaxis_title="Portfolio Value",
+                    title="Equity Curve",
+                    yaxis_type="log" if pf_value.max() > 10000 else "linear"  # Log scale for large values
+                )
+                st.plotly_chart(fig_pnl)
+
+                # --- Cumulative Returns ---
+                st.subheader("📈 Cumulative Returns")
+                fig_cum = go.Figure()
+                fig_cum.add_trace(go.Scattergl(
+                    x=pf_cum.index, 
+                    y=pf_cum,
+                    mode='lines',
+                    name="Cumulative Returns"
+                ))
+                fig_cum.update_layout(
+                    yaxis_title="Cumulative Returns",
+                    title="Cumulative Returns Curve",
+                    yaxis_type="log" if pf_cum.max() > 10 else "linear"  # Log scale for large movements
+                )
+                st.plotly_chart(fig_cum)
 
-        # Assuming 'pf' is the portfolio object generated from your backtest
-
-        with st.spinner("Loading Backtest statistics..."):
+                # Returns Overview (pf.returns is a property, not a method)
+                st.subheader("📊 Returns Overview")
+                returns_df = st.session_state.pf_returns.to_frame(name="Returns")
+                st.dataframe(returns_df)
 
-            st.subheader("📊 Detailed Portfolio Statistics")
-            stats_df = pf.stats().to_frame(name='Value')
 
-            # Convert Timedelta values to strings
-            stats_df["Value"] = stats_df["Value"].apply(lambda x: str(x) if isinstance(x, pd.Timedelta) else x)
+                # Trade History
+                st.subheader("📝 Trade History")
+                show_records_grid(st.session_state.pf_trade_history, st.session_state.pf_trade_history_grid, key="run_trade_history_grid")
 
-            st.dataframe(stats_df)
+                # Trade Signals (Records in a human-readable format)
+                st.subheader("📌 Trade Signals")
+                show_records_grid(st.session_state.pf_trades_df, st.session_state.pf_trades_grid, key="run_trade_records_grid")
 
-            # --- Equity (PNL) Curve ---
-            st.subheader("📈 Equity (PNL) Curve")
-            fig_pnl = go.Figure()
-            fig_pnl.add_trace(go.Scatter(
-                x=pf.value.index, 
-                y=pf.value,
-                mode='lines',
-                name="Portfolio Value"
-            ))
-            fig_pnl.update_layout(
-                yaxis_title="Portfolio Value",
-                title="Equity Curve",
-                yaxis_type="log" if pf.value.max() > 10000 else "linear"  # Log scale for large values
-            )
-            st.plotly_chart(fig_pnl)
-
-            # --- Cumulative Returns ---
-            st.subheader("📈 Cumulative Returns")
-            fig_cum = go.Figure()
-            fig_cum.add_trace(go.Scatter(
-                x=pf.cumulative_returns.index, 
-                y=pf.cumulative_returns,
-                mode='lines',
-                name="Cumulative Returns"
-            ))
-            fig_cum.update_layout(
-                yaxis_title="Cumulative Returns",
-                title="Cumulative Returns Curve",
-                yaxis_type="log" if pf.cumulative_returns.max() > 10 else "linear"  # Log scale for large movements
-            )
-            st.plotly_chart(fig_cum)
-
-            # Returns Overview (pf.returns is a property, not a method)
-            st.subheader("📊 Returns Overview")
-            returns_series = pf.returns
-            returns_df = returns_series.to_frame(name="Returns")
-            st.dataframe(returns_df)
 
+            with st.spinner("Loading Advanced statistic plots..."):
+                # Expanding Maximum Favorable Excursion (MFE)
+                st.subheader("📊 Expanding MFE")
+                fig_mfe = pf.trades.plot_expanding_mfe_returns()
+                st.plotly_chart(fig_mfe)
 
-            # Trade History
-            st.subheader("📝 Trade History")
-            st.dataframe(pf.trade_history)
+                # Expanding Maximum Adverse Excursion (MAE)
+                st.subheader("📊 Expanding MAE")
+                fig_mae = pf.trades.plot_expanding_mae_returns()
+                st.plotly_chart(fig_mae)
 
-            # Trade Signals (Records in a human-readable format)
-            st.subheader("📌 Trade Signals")
-            st.dataframe(pf.trades.records_readable)
-        
 
-        with st.spinner("Loading Advanced statistic plots..."):
-            # Expanding Maximum Favorable Excursion (MFE)
-            st.subheader("📊 Expanding MFE")
-            fig_mfe = pf.trades.plot_expanding_mfe_returns()
-            st.plotly_chart(fig_mfe)
+                # Risk-adjusted Metrics: Sharpe & Sortino Ratios
+                sharpe_ratio = pf.get_sharpe_ratio()
+                sortino_ratio = pf.get_sortino_ratio()
+                st.metric(label="📈 Sharpe Ratio", value=f"{int(sharpe_ratio):.2f}")
+                st.metric(label="📈 Sortino Ratio", value=f"{int(sortino_ratio):.2f}")
 
-            # Expanding Maximum Adverse Excursion (MAE)
-            st.subheader("📊 Expanding MAE")
-            fig_mae = pf.trades.plot_expanding_mae_returns()
-            st.plotly_chart(fig_mae)
+                # Benchmark Comparison (if available)
+                if hasattr(pf, 'benchmark_cumulative_returns'):
+                    st.subheader("📊 Benchmark vs Portfolio Performance")
+                    st.line_chart(pf.benchmark_cumulative_returns)
 
 
-            # Risk-adjusted Metrics: Sharpe & Sortino Ratios
-            sharpe_ratio = pf.get_sharpe_ratio()
-            sortino_ratio = pf.get_sortino_ratio()
-            st.metric(label="📈 Sharpe Ratio", value=f"{int(sharpe_ratio):.2f}")
-            st.metric(label="📈 Sortino Ratio", value=f"{int(sortino_ratio):.2f}")
-
-            # Benchmark Comparison (if available)
-            if hasattr(pf, 'benchmark_cumulative_returns'):
-                st.subheader("📊 Benchmark vs Portfolio Performance")
-                st.line_chart(pf.benchmark_cumulative_returns)
-        
-
     # 📌 Save Portfolio with Metadata
     st.subheader("💾 Save Backtest Portfolio")
     save_filename = st.text_input("Enter filename to save (without extension):", value=f"{selected_module}_{timeframe}_{date.today()}")
@@ -584,19 +676,9 @@ def show_backtester_page():
                     col1, col2 = st.columns(2)
 
                     with col1:
-                        st.write(f"**Strategy Name:** {params['strategy_name']}")
-                        st.write(f"**Market Name:** {params['market_name']}")
-                        st.write(f"**Timeframe:** {params['timeframe']}")
-                        st.write(f"**Symbols:** {', '.join(params['symbol_list'])}")
-                        st.write(f"**Trading Pair:** {params['pair']}")
-                        st.write(f"**Start Date:** {params['start_date']}")
-                        st.write(f"**End Date:** {params['end_date']}")
+                        st.table(backtest_summary_frame(params))
 
                     with col2:
-                        st.write(f"**Initial Cash:** ${params['init_cash']:,.2f}")
-                        st.write(f"**Trading Fees:** {params['fees'] * 100:.4f}%")
-                        st.write(f"**Slippage:** {params['slippage'] * 100:.4f}%")
-                        st.write(f"**Allow Partial Orders:** {params['allow_partial']}")
                         st.write("**Strategy Parameters:**")
                         st.json(params["strategy_params"])
 
@@ -616,59 +698,58 @@ def show_backtester_page():
                         # ✅ Success message
                         st.success(f"Successfully loaded backtest: {selected_backtest}")
 
+                        store_portfolio_results(pf)
+                        pf_value = st.session_state.pf_value
+                        pf_cum = st.session_state.pf_cum
+
                         # 📊 Display Portfolio Statistics
                         st.subheader("📊 Portfolio Statistics")
-                        stats_df = pf.stats().to_frame(name="Value")
-
-                        # Convert Timedelta values to readable format
-                        stats_df["Value"] = stats_df["Value"].apply(lambda x: str(x) if isinstance(x, pd.Timedelta) else x)
-
-                        st.dataframe(stats_df)
+                        st.dataframe(st.session_state.pf_stats)
 
                         # --- 📈 Equity (PNL) Curve ---
                         st.subheader("📈 Equity (PNL) Curve")
                         fig_pnl = go.Figure()
-                        fig_pnl.add_trace(go.Scatter(
-                            x=pf.value.index, 
-                            y=pf.value,
+                        fig_pnl.add_trace(go.Scattergl(
+                            x=pf_value.index, 
+                            y=pf_value,
                             mode='lines',
                             name="Portfolio Value"
                         ))
                         fig_pnl.update_layout(
                             yaxis_title="Portfolio Value",
                             title="Equity Curve",
-                            yaxis_type="log" if pf.value.max() > 10000 else "linear"
+                            yaxis_type="log" if pf_value.max() > 10000 else "linear"
                         )
                         st.plotly_chart(fig_pnl)
 
                         # --- 📈 Cumulative Returns ---
                         st.subheader("📈 Cumulative Returns")
                         fig_cum = go.Figure()
-                        fig_cum.add_trace(go.Scatter(
-                            x=pf.cumulative_returns.index, 
-                            y=pf.cumulative_returns,
+                        fig_cum.add_trace(go.Scattergl(
+                            x=pf_cum.index, 
+                            y=pf_cum,
                             mode='lines',
                             name="Cumulative Returns"
                         ))
                         fig_cum.update_layout(
                             yaxis_title="Cumulative Returns",
                             title="Cumulative Returns Curve",
-                            yaxis_type="log" if pf.cumulative_returns.max() > 10 else "linear"
+                            yaxis_type="log" if pf_cum.max() > 10 else "linear"
                         )
                         st.plotly_chart(fig_cum)
 
                         # 📊 Returns Overview
                         st.subheader("📊 Returns Overview")
-                        returns_df = pf.returns.to_frame(name="Returns")
+                        returns_df = st.session_state.pf_returns.to_frame(name="Returns")
                         st.dataframe(returns_df)
 
                         # 📑 Trade History
                         st.subheader("📝 Trade History")
-                        st.dataframe(pf.trade_history)
+                        show_records_grid(st.session_state.pf_trade_history, st.session_state.pf_trade_history_grid, key="loaded_trade_history_grid")
 
                         # 🔍 Trade Signals
                         st.subheader("📌 Trade Signals")
-                        st.dataframe(pf.trades.records_readable)
+                        show_records_grid(st.session_state.pf_trades_df, st.session_state.pf_trades_grid, key="loaded_trade_records_grid")
 
                         # 🔍 Advanced Metrics & Risk Analysis
                         with st.spinner("Loading Advanced Statistics..."):
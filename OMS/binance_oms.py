@@ -1,120 +1,890 @@
 import os
 import sys
+import asyncio
+from binance import AsyncClient
 from binance.client import Client
-from binance.exceptions import BinanceAPIException
+from binance.exceptions import BinanceAPIException, BinanceRequestException
 from dotenv import load_dotenv
 import pandas as pd
 from OMS.telegram import Telegram  # Assuming this is a custom Telegram integration module
 import json
-import math
+import gzip
+import zlib
+import tempfile
+from decimal import Decimal
 import time
 import threading
+import queue
+import random
+import statistics
+import uuid
+import functools
+import weakref
+from types import MappingProxyType
+import inspect
+import requests
+import urllib3
+import aiohttp
+from requests.adapters import HTTPAdapter
 from OMS.oms import OMS
-from concurrent.futures import ThreadPoolExecutor
+from OMS.binance_ws_api import BinanceWsApi, RequestStatusUnknown, SPOT_WS_API_URL, FUTURES_WS_API_URL
+
+try:
+    import orjson
+except ImportError:  # Optional, responses are parsed with the stdlib json module without it
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Notifications are coalesced into one Telegram message per interval (seconds), within Telegram's size limit
+TELEGRAM_FLUSH_INTERVAL = 1.0
+TELEGRAM_MAX_MESSAGE_CHARS = 4096
+
+# Equivalent Binance REST clusters, see Binance(tune_endpoint=True)
+SPOT_HOSTS = ('api.binance.com', 'api1.binance.com', 'api2.binance.com', 'api3.binance.com', 'api4.binance.com')
+FUTURES_HOSTS = ('fapi.binance.com', 'fapi1.binance.com', 'fapi2.binance.com', 'fapi3.binance.com')
+
+# Signed requests are timestamped with a local clock offset refreshed this often (seconds)
+TIME_SYNC_INTERVAL = 3600
+
+# Concurrent closes in close_futures_positions, and orders per second allowed across them
+CLOSE_POSITION_WORKERS = 8
+ORDER_RATE_LIMIT = 10
+
+# Binance caps /fapi/v1/batchOrders at 5 orders per request
+FUTURES_BATCH_SIZE = 5
+
+# Futures lot/price filters rarely change, refetch the exchange info at most this often (seconds)
+EXCHANGE_INFO_TTL = 3600
+# Last exchange info snapshot shared across processes, so a cold start can skip the fetch
+EXCHANGE_INFO_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'binance_oms', 'fapi_exchange_info.json.gz')
+
+# Rate limits and server-side errors are worth retrying, 418 (IP ban) and other 4xx are not
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Binance -2013: Order does not exist
+ORDER_NOT_FOUND_CODE = -2013
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, BinanceAPIException):
+        return error.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout, asyncio.TimeoutError))
+
+def _never_sent(error: Exception) -> bool:
+    """
+    True when the request cannot have executed, so resending an order cannot place it twice:
+    a 429 from the rate limiter, or a failure while connecting.
+    """
+    if isinstance(error, BinanceAPIException):
+        return error.status_code == 429
+    if isinstance(error, (requests.exceptions.ConnectTimeout, aiohttp.ClientConnectorError)):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        # Resets while reading the response land here too, only a failed connect is safe
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(reason, urllib3.exceptions.NewConnectionError)
+    return False
+
+def _outcome_unknown(error: Exception) -> bool:
+    """
+    True when an order request may or may not have executed, Binance documents 5xx as "execution status unknown".
+    """
+    if _never_sent(error):
+        return False
+    if isinstance(error, BinanceAPIException):
+        return error.status_code >= 500
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                              asyncio.TimeoutError, aiohttp.ClientError, RequestStatusUnknown))
+
+def _backoff(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+def with_retry(max_attempts: int = 3, base: float = 1.0, cap: float = 30.0, retry_on=_is_transient):
+    """
+    Retries errors for which `retry_on(error)` is true (transient Binance/network errors by default) with
+    exponential backoff and full jitter, sleeping uniform(0, min(cap, base * 2**attempt)) between attempts.
+    Anything else is raised as is. Works on both plain and async functions.
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if attempt == max_attempts - 1 or not retry_on(e):
+                            raise
+                        await asyncio.sleep(_backoff(attempt, base, cap))
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_attempts - 1 or not retry_on(e):
+                        raise
+                    time.sleep(_backoff(attempt, base, cap))
+        return wrapper
+    return decorator
+
+@with_retry()
+def _call_api(func, *args, **kwargs):
+    return func(*args, **kwargs)
+
+@with_retry()
+async def _call_api_async(func, *args, **kwargs):
+    return await func(*args, **kwargs)
+
+# Order placement is not idempotent, it is only retried when the request cannot have executed
+@with_retry(retry_on=_never_sent)
+def _call_order_api(func, *args, **kwargs):
+    return func(*args, **kwargs)
+
+@with_retry(retry_on=_never_sent)
+async def _call_order_api_async(func, *args, **kwargs):
+    return await func(*args, **kwargs)
+
+def _decimal_places(value_str: str) -> int:
+    """
+    Digits after the decimal point of an exchange filter string, e.g. "0.00100" -> 3, "1.0" -> 0.
+    """
+    trimmed = value_str.rstrip('0') if '.' in value_str else value_str
+    return len(trimmed.split('.')[1]) if '.' in trimmed else 0
+
+TELEGRAM_MARKDOWN_ENTITIES = ('*', '_', '`', '[')
+
+def _markdown_safe(message: str) -> str:
+    """
+    `message` as is if its Markdown entities are balanced, otherwise with them escaped to render literally.
+    Telegram rejects a whole message over one unclosed entity, which would take the rest of its batch with it.
+    """
+    if all(message.count(c) % 2 == 0 for c in '*_`') and message.count('[') == message.count(']'):
+        return message
+    for c in TELEGRAM_MARKDOWN_ENTITIES:
+        message = message.replace(c, '\\' + c)
+    return message
+
+class _Notifier:
+    """
+    Telegram notifications queued from the order paths and sent by one background thread, batching whatever
+    arrives within TELEGRAM_FLUSH_INTERVAL of the first message. Shared per process per channel, see _get_notifier.
+    """
+
+    _STOP = object()
+
+    def __init__(self, telegram: Telegram):
+        self.telegram = telegram
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+        # Not atexit: that runs after concurrent.futures has shut down its executors, and Telegram
+        # sends through one. Threading exit hooks run first, in reverse, so the last batch still goes out
+        threading._register_atexit(self.close)
+
+    def notify(self, message: str):
+        self._queue.put(_markdown_safe(message))
+
+    def flush(self):
+        """
+        Blocks until everything queued so far has been handed to Telegram.
+        """
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self, timeout: float = 10.0):
+        """
+        Sends whatever is still queued and stops the thread.
+        """
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+
+    def _send(self, batch: list):
+        try:
+            self.telegram.send_telegram_message("\n\n".join(batch))
+        except Exception as e:  # One failed send must not stop every later alert
+            print(f"Failed to send Telegram notification: {e}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _drain(self):
+        pending = None
+        while True:
+            first = pending if pending is not None else self._queue.get()
+            pending = None
+            if first is self._STOP:
+                self._queue.task_done()
+                return
+            batch = [first]
+            size = len(first)
+            deadline = time.monotonic() + TELEGRAM_FLUSH_INTERVAL
+            while True:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    message = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if message is self._STOP or size + len(message) + 2 > TELEGRAM_MAX_MESSAGE_CHARS:
+                    pending = message  # Starts the next batch, or stops right after this one
+                    break
+                batch.append(message)
+                size += len(message) + 2
+            self._send(batch)
+
+_notifiers = {}
+_notifiers_lock = threading.Lock()
+
+def _get_notifier(token: str, group_id: str) -> _Notifier:
+    """
+    One notifier (and drain thread) per Telegram channel per process, however many Binance instances are built.
+    """
+    with _notifiers_lock:
+        key = (token, group_id)
+        if key not in _notifiers:
+            _notifiers[key] = _Notifier(Telegram(token=token, group_id=group_id))
+        return _notifiers[key]
+
+class _ServerTimeSync:
+    """
+    Keeps the server clock offset of every live Binance instance current from one daemon thread.
+    The offset is a property of the local clock, so it is measured once per interval and shared.
+    Instances are held weakly, dropping a Binance is enough to stop syncing it.
+    """
+
+    def __init__(self):
+        self.offset = None  # Server time minus local time (ms), None until the first successful sync
+        self._instances = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def register(self, binance):
+        with self._lock:
+            self._instances.add(binance)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        if self.offset is None:
+            self.sync(binance.client)
+        else:
+            binance._set_timestamp_offset(self.offset)
+
+    def unregister(self, binance):
+        with self._lock:
+            self._instances.discard(binance)
+
+    def sync(self, client: Client):
+        """
+        Measures the offset with `client` and applies it to every registered instance.
+        """
+        try:
+            sent = time.time() * 1000
+            server_time = _call_api(client.get_server_time)['serverTime']
+            received = time.time() * 1000
+        except (BinanceAPIException, requests.exceptions.RequestException) as e:
+            print(f"Failed to sync Binance server time, keeping the previous offset: {e}")
+            return
+        # The server read its clock roughly halfway through the round-trip
+        self.offset = int(server_time - (sent + received) / 2)
+        with self._lock:
+            instances = list(self._instances)
+        for instance in instances:
+            instance._set_timestamp_offset(self.offset)
+
+    def _run(self):
+        while True:
+            time.sleep(TIME_SYNC_INTERVAL)
+            with self._lock:
+                instances = list(self._instances)
+            if instances:
+                self.sync(instances[0].client)
+
+_time_sync = _ServerTimeSync()
+
+class _RateLimiter:
+    """
+    At most `rate` acquisitions per second across threads, each permit is handed back one second after it is taken.
+    """
+
+    def __init__(self, rate: int):
+        self._permits = threading.Semaphore(rate)
+
+    def acquire(self):
+        self._permits.acquire()
+        self._release_later()
+
+    async def acquire_async(self):
+        # Polls instead of blocking so waiting coroutines don't hold the event loop or a thread
+        while not self._permits.acquire(blocking=False):
+            await asyncio.sleep(0.05)
+        self._release_later()
+
+    def _release_later(self):
+        timer = threading.Timer(1.0, self._permits.release)
+        timer.daemon = True
+        timer.start()
+
+def _ping_latency(url: str, attempts: int = 3) -> float:
+    """
+    Median round-trip of GET `url` in seconds over one keep-alive session, inf if it fails.
+    """
+    samples = []
+    with requests.Session() as session:
+        for _ in range(attempts):
+            start = time.perf_counter()
+            try:
+                session.get(url, timeout=2).raise_for_status()
+            except requests.exceptions.RequestException:
+                return float('inf')
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+def _fastest_host(hosts: tuple, ping_path: str) -> str:
+    with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+        latencies = list(executor.map(lambda host: _ping_latency(f"https://{host}{ping_path}"), hosts))
+    return min(zip(latencies, hosts))[1]
+
+# Display formats of the view_open_futures_positions columns
+POSITION_DISPLAY_FORMATS = {
+    'Size (USD)': "${:,.2f}",
+    'Entry Price': "${:,.2f}",
+    'Mark Price': "${:,.2f}",
+    'PNL (Unrealized)': "${:,.2f}",
+    'Liquidation Price': "${:,.2f}",
+    'Leverage': "{}x",
+}
+
+def _read_exchange_info_cache():
+    """
+    {'ts': ..., 'symbols': [...]} from EXCHANGE_INFO_CACHE_PATH, or None when missing, unreadable or expired.
+    """
+    try:
+        with gzip.open(EXCHANGE_INFO_CACHE_PATH, 'rb') as f:
+            cached = orjson.loads(f.read()) if orjson else json.loads(f.read())
+    except (OSError, ValueError, EOFError, zlib.error):  # Missing, truncated or corrupt
+        return None
+    if not (isinstance(cached, dict) and isinstance(cached.get('ts'), (int, float))
+            and isinstance(cached.get('symbols'), list)):
+        return None
+    if time.time() - cached['ts'] > EXCHANGE_INFO_TTL:
+        return None
+    return cached
+
+def _write_exchange_info_cache(symbols: list, fetched_at: float):
+    payload = {'ts': fetched_at, 'symbols': symbols}
+    data = orjson.dumps(payload) if orjson else json.dumps(payload).encode()
+    try:
+        os.makedirs(os.path.dirname(EXCHANGE_INFO_CACHE_PATH), exist_ok=True)
+        # Write to a file of our own then rename, so concurrent readers never see a partial file
+        # and concurrent writers (threads or processes) never share a temp file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(EXCHANGE_INFO_CACHE_PATH), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(data)
+            os.replace(tmp_path, EXCHANGE_INFO_CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"Failed to persist exchange info cache: {e}")
+
+class OrjsonClient(Client):
+    """
+    Client that parses REST responses with orjson, several times faster than the stdlib on the large
+    exchange info and account payloads.
+    """
+
+    def _handle_response(self, response):
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # Same as the library, some endpoints answer with an empty body
+            if response.text == "":
+                return {}
+            raise BinanceRequestException(f"Invalid Response: {response.text}")
+
+@functools.cache
+def _get_config() -> dict:
+    """
+    config/.env loaded and the Telegram channel JSON parsed once per process, not per Binance instance.
+    Variables already set in the environment take precedence over the file.
+    """
+    load_dotenv(dotenv_path='config/.env')
+    return {
+        'api_key': os.getenv('BINANCE_API_KEY'),
+        'api_secret': os.getenv('BINANCE_API_SECRET'),
+        'telegram_token': os.getenv('TELEGRAM_TOKEN'),
+        'telegram_channels': json.loads(os.getenv('TELEGRAM_BOT_CHANNELS', '{}')),
+    }
+
+@functools.lru_cache(maxsize=256)
+def _order_template(symbol: str, side: str, order_type: str) -> MappingProxyType:
+    """
+    Normalized, read-only symbol/side/type (+ timeInForce for LIMIT) params, built once per combination.
+    """
+    template = {
+        'symbol': symbol.upper(),
+        'side': side.upper(),
+        'type': order_type.upper(),
+    }
+    if template['type'] == 'LIMIT':
+        template['timeInForce'] = 'GTC'
+    return MappingProxyType(template)
 
 class Binance(OMS):
 
-    def __init__(self, binance_api_key: str = '', binance_api_secret: str = ''):
+    def __init__(self, binance_api_key: str = '', binance_api_secret: str = '', use_ws_trade_api: bool = False,
+                 tune_endpoint: bool = False):
+        """
+        Args:
+            binance_api_key (str, optional): Defaults to BINANCE_API_KEY from config/.env.
+            binance_api_secret (str, optional): Defaults to BINANCE_API_SECRET from config/.env.
+            use_ws_trade_api (bool, optional): Place orders over the persistent WebSocket API
+                                               instead of REST, REST stays the fallback.
+            tune_endpoint (bool, optional): Ping every spot/futures REST cluster in parallel at startup
+                                            and send all requests to the fastest one.
+        """
         super().__init__()
         # Load API keys from environment variables if not provided
-        load_dotenv(dotenv_path='config/.env')
-        self.api_key = binance_api_key or os.getenv('BINANCE_API_KEY')
-        self.api_secret = binance_api_secret or os.getenv('BINANCE_API_SECRET')
+        config = _get_config()
+        self.api_key = binance_api_key or config['api_key']
+        self.api_secret = binance_api_secret or config['api_secret']
 
         if not self.api_key or not self.api_secret:
             raise ValueError("Binance API key and secret must be provided or set in the .env file.")
         
         # Initialize Binance client
-        self.client = Client(self.api_key, self.api_secret)
-        self.client.futures_account()  # Ensure the account is enabled for Futures
-        self.group_id = json.loads(os.getenv('TELEGRAM_BOT_CHANNELS'))['debug_logs']
-        self.telegram = Telegram(token=os.getenv('TELEGRAM_TOKEN'), group_id=self.group_id)
+        # ping=False skips the client's startup /ping, the clock offset is kept current by _time_sync
+        client_class = OrjsonClient if orjson else Client
+        self.client = client_class(self.api_key, self.api_secret, ping=False)
+        # Chaser threads and concurrent closes share this session, keep their keep-alive connections pooled
+        # instead of queueing on (or discarding past) urllib3's default 10 per host. Retries are with_retry's job.
+        self.client.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=64, max_retries=0))
+        if tune_endpoint:
+            self._tune_endpoints()
+        # Futures access is checked on first Futures use, see _ensure_futures
+        self._futures_verified = False
+        self.group_id = config['telegram_channels']['debug_logs']
+        # Order paths only enqueue, the shared notifier thread does the Telegram I/O
+        self._notifier = _get_notifier(config['telegram_token'], self.group_id)
+        self.telegram = self._notifier.telegram
 
         self.successful_orders = []
         self.failed_orders = []
 
+        self._order_rate_limiter = _RateLimiter(ORDER_RATE_LIMIT)
+        self.use_ws_trade_api = use_ws_trade_api
+        self._ws_apis = {}  # WS API url -> BinanceWsApi, connected on first order
+        self._ws_apis_lock = threading.Lock()
+        _time_sync.register(self)
+
+        # symbol -> precision details, see _get_symbol_filters
+        self._symbol_filters = {}
+        self._exchange_info_ts = 0.0
+        self._symbol_filters_lock = threading.Lock()
+
+    def _notify(self, message: str):
+        self._notifier.notify(message)
+
+    def close(self):
+        """
+        Stops the server time sync for this instance, closes its WS API connections and waits for queued
+        notifications to go out. The notifier is shared, it keeps running for other instances.
+        """
+        _time_sync.unregister(self)
+        for ws_api in list(self._ws_apis.values()):
+            ws_api.close()
+        self._notifier.flush()
+
+    def _set_symbol_filters(self, symbols: list, fetched_at: float):
+        """
+        Builds the symbol -> filters map from the `symbols` of a futures_exchange_info() response.
+        """
+        symbol_filters = {}
+        for info in symbols:
+            filters = {f['filterType']: f for f in info['filters']}
+            step_str = filters['LOT_SIZE']['stepSize']  # Quantity precision
+            tick_str = filters['PRICE_FILTER']['tickSize']  # Price precision
+            step_size = float(step_str)
+            tick_size = float(tick_str)
+            symbol_filters[info['symbol']] = {
+                'stepSize': step_size,
+                'tickSize': tick_size,
+                # Built from the API strings, exact where the floats are not
+                'stepDec': Decimal(step_str),
+                'tickDec': Decimal(tick_str),
+                'tickPrecision': _decimal_places(tick_str),
+                'minNotional': float(filters.get('MIN_NOTIONAL', {}).get('notional', 0)),
+            }
+        self._symbol_filters = symbol_filters
+        self._exchange_info_ts = fetched_at
+
+    def _refresh_symbol_filters(self):
+        """
+        Rebuilds the symbol -> filters map from a single futures_exchange_info() call and persists it to disk.
+        """
+        exchange_info = _call_api(self.client.futures_exchange_info)
+        symbols = [{'symbol': info['symbol'], 'filters': info['filters']} for info in exchange_info['symbols']]
+        fetched_at = time.time()
+        _write_exchange_info_cache(symbols, fetched_at)
+        self._set_symbol_filters(symbols, fetched_at)
+
+    def _get_symbol_filters(self, symbol: str) -> dict:
+        """
+        Precision details for a Futures symbol from the cached exchange info.
+        The cache is seeded from EXCHANGE_INFO_CACHE_PATH on first use and refreshed once it is older than
+        EXCHANGE_INFO_TTL, or when the symbol is missing (new listing).
+
+        Returns:
+            dict: stepSize, tickSize (float), stepDec, tickDec (Decimal), tickPrecision and minNotional of the symbol.
+        """
+        symbol = symbol.upper()
+        seen_ts = self._exchange_info_ts
+        if symbol not in self._symbol_filters or time.time() - seen_ts > EXCHANGE_INFO_TTL:
+            # Concurrent close workers miss together, one of them loads the filters and the rest reuse them
+            with self._symbol_filters_lock:
+                if self._exchange_info_ts == seen_ts:
+                    if not self._symbol_filters:
+                        # Cold start, a recent enough snapshot from a previous process saves the round-trip
+                        cached = _read_exchange_info_cache()
+                        if cached:
+                            self._set_symbol_filters(cached['symbols'], cached['ts'])
+                    if symbol not in self._symbol_filters or time.time() - self._exchange_info_ts > EXCHANGE_INFO_TTL:
+                        self._refresh_symbol_filters()
+        try:
+            return self._symbol_filters[symbol]
+        except KeyError:
+            raise ValueError(f"Symbol {symbol} not found in exchange info.") from None
+
+    def _tune_endpoints(self):
+        """
+        Points the client at the lowest latency spot and futures clusters.
+        """
+        spot_host = _fastest_host(SPOT_HOSTS, '/api/v3/ping')
+        futures_host = _fastest_host(FUTURES_HOSTS, '/fapi/v1/ping')
+        self.client.API_URL = f"https://{spot_host}/api"
+        self.client.FUTURES_URL = f"https://{futures_host}/fapi"
+        print(f"Using Binance endpoints {spot_host} and {futures_host}")
+
+    def _set_timestamp_offset(self, offset: int):
+        """
+        Server clock offset used to timestamp signed requests, see _ServerTimeSync.
+        """
+        self.client.timestamp_offset = offset
+        for ws_api in list(self._ws_apis.values()):
+            ws_api.timestamp_offset = offset
+
+    def _ensure_futures(self):
+        """
+        Ensures the account is enabled for Futures, once per instance so spot-only use never pays for it.
+        """
+        if not self._futures_verified:
+            _call_api(self.client.futures_account)
+            self._futures_verified = True
+
+    def _get_ws_api(self, futures: bool) -> BinanceWsApi:
+        url = FUTURES_WS_API_URL if futures else SPOT_WS_API_URL
+        # Close workers and chasers get here concurrently, build one client per url
+        with self._ws_apis_lock:
+            if url not in self._ws_apis:
+                ws_api = BinanceWsApi(self.api_key, self.api_secret, url=url)
+                ws_api.timestamp_offset = self.client.timestamp_offset
+                self._ws_apis[url] = ws_api
+            return self._ws_apis[url]
+
+    def _create_order(self, futures: bool = False, **params):
+        """
+        create_order / futures_create_order, sent over the WebSocket API when `use_ws_trade_api` is set.
+        Falls back to REST only when the request never reached Binance (no connection).
+        """
+        if self.use_ws_trade_api:
+            try:
+                return self._get_ws_api(futures).request("order.place", params)
+            except ConnectionError as e:
+                print(f"WS API unavailable, placing order over REST: {e}")
+        if futures:
+            return self.client.futures_create_order(**params)
+        return self.client.create_order(**params)
+
+    def _find_order(self, futures: bool, symbol: str, client_order_id: str):
+        """
+        The order placed with `client_order_id`, or None if Binance has no such order.
+        """
+        get_order = self.client.futures_get_order if futures else self.client.get_order
+        try:
+            return _call_api(get_order, symbol=symbol, origClientOrderId=client_order_id)
+        except BinanceAPIException as e:
+            if e.code == ORDER_NOT_FOUND_CODE:
+                return None
+            raise
+
+    def _submit_order(self, futures: bool = False, max_attempts: int = 3, **params):
+        """
+        `_create_order` retried only when the order cannot have executed. When the outcome is unknown
+        (5xx, timeout, connection lost mid-request) the order is looked up by its client order id and
+        resent only if Binance has no record of it.
+        """
+        params.setdefault('newClientOrderId', uuid.uuid4().hex)
+        for attempt in range(max_attempts):
+            try:
+                return _call_order_api(self._create_order, futures=futures, **params)
+            except Exception as e:
+                if attempt == max_attempts - 1 or not _outcome_unknown(e):
+                    raise
+                time.sleep(_backoff(attempt))  # Give an in-flight order time to show up before looking for it
+                order = self._find_order(futures, params['symbol'], params['newClientOrderId'])
+                if order is not None:
+                    return order
+
+    async def _submit_order_async(self, async_client: AsyncClient, max_attempts: int = 3, **params):
+        """
+        `_submit_order` for spot orders on an AsyncClient.
+        """
+        params.setdefault('newClientOrderId', uuid.uuid4().hex)
+        for attempt in range(max_attempts):
+            try:
+                return await _call_order_api_async(async_client.create_order, **params)
+            except Exception as e:
+                if attempt == max_attempts - 1 or not _outcome_unknown(e):
+                    raise
+                await asyncio.sleep(_backoff(attempt))
+                try:
+                    return await _call_api_async(async_client.get_order, symbol=params['symbol'],
+                                                 origClientOrderId=params['newClientOrderId'])
+                except BinanceAPIException as lookup_error:
+                    if lookup_error.code != ORDER_NOT_FOUND_CODE:
+                        raise
+
     def iterate_orders_df(self, orders: pd.DataFrame) -> tuple[list, list]:
-        if not orders.empty:
-            for _, row in orders.iterrows():
-                symbol = row['Symbol']
-                side = row['Side']
-                size = float(row['Size'])
-                price = float(row['Price'])
+        """
+        Places every order in `orders` concurrently, see `iterate_orders_df_async`.
+        """
+        return asyncio.run(self.iterate_orders_df_async(orders))
 
-                self.place_order(symbol, side, size, price)
+    async def iterate_orders_df_async(self, orders: pd.DataFrame) -> tuple[list, list]:
+        """
+        Submits the orders concurrently on an AsyncClient instead of one round-trip after another,
+        at most ORDER_RATE_LIMIT in flight and per second. Orders go over the WS API when `use_ws_trade_api` is set.
 
-            return self.successful_orders, self.failed_orders
-        else:
+        Args:
+            orders (pd.DataFrame): Orders with Symbol, Side, Size and Price columns.
+
+        Returns:
+            tuple: successful_orders, failed_orders
+        """
+        if orders.empty:
             return [], []
 
-    def place_order(self, symbol: str, side: str, size: float, price: float = 0.0, order_type: str = 'MARKET'):
+        # Cast columns once instead of float() per row
+        orders = orders.astype({'Size': 'float64', 'Price': 'float64'}, copy=False)
+        rows = list(zip(
+            orders['Symbol'].to_numpy(),
+            orders['Side'].to_numpy(),
+            orders['Size'].to_numpy().tolist(),
+            orders['Price'].to_numpy().tolist()
+        ))
+
+        async_client = await AsyncClient.create(self.api_key, self.api_secret)
+        async_client.timestamp_offset = self.client.timestamp_offset  # Kept current by _time_sync
+        in_flight = asyncio.Semaphore(ORDER_RATE_LIMIT)
+
+        async def place(symbol, side, size, price):
+            async with in_flight:
+                await self._order_rate_limiter.acquire_async()
+                await self._place_order_async(async_client, symbol, side, size, price)
+
         try:
-            order_params = {
-                'symbol': symbol,
-                'side': side.upper(),
-                'type': order_type.upper(),
-                'quantity': size
-            }
+            results = await asyncio.gather(
+                *(place(symbol, side, size, price) for symbol, side, size, price in rows),
+                return_exceptions=True
+            )
+        finally:
+            await async_client.close_connection()
+
+        # Binance errors are logged by _place_order_async, anything else (network, timeouts) lands here
+        for (symbol, side, size, price), result in zip(rows, results):
+            if isinstance(result, Exception):
+                self._log_failed_order(symbol, side, size, price, result)
+
+        return self.successful_orders, self.failed_orders
+
+    @staticmethod
+    def _order_params(symbol: str, side: str, quantity, price, order_type: str) -> dict:
+        """
+        Order request params, on top of the cached (symbol, side, type) template.
+        """
+        order_params = dict(_order_template(symbol, side, order_type))
+        order_params['quantity'] = quantity
+        # Fixed per order, so a submission with an unknown outcome can be looked up by origClientOrderId before it is resent.
+        # Binance only rejects a reused id while the original is open, a filled order does not block a duplicate
+        order_params['newClientOrderId'] = uuid.uuid4().hex
+        if order_params['type'] == 'LIMIT':
+            order_params['price'] = price
+        return order_params
+
+    def _log_failed_order(self, symbol: str, side: str, size: float, price: float, error: Exception):
+        self.failed_orders.append({
+            'symbol': symbol,
+            'side': side,
+            'size': size,
+            'price': price,
+            'error': str(error)
+        })
+        self._notify(f"Failed to place order:\nSymbol: {symbol}, Side: {side}, Error: {error}")
+
+    async def _place_order_async(self, async_client: AsyncClient, symbol: str, side: str, size: float, price: float = 0.0, order_type: str = 'MARKET'):
+        try:
+            params = self._order_params(symbol, side, size, price, order_type)
+            if self.use_ws_trade_api:
+                # The WS API client blocks on its response, keep the event loop free
+                order = await asyncio.to_thread(self._submit_order, **params)
+            else:
+                order = await self._submit_order_async(async_client, **params)
 
-            if order_type.upper() == 'LIMIT':
-                order_params['timeInForce'] = 'GTC'
-                order_params['price'] = price
+            # Log successful order
+            self.successful_orders.append(order)
+            self._notify(f"Order placed successfully:\n{order}")
 
+        except BinanceAPIException as e:
+            self._log_failed_order(symbol, side, size, price, e)
+
+    def place_order(self, symbol: str, side: str, size: float, price: float = 0.0, order_type: str = 'MARKET'):
+        try:
             # Send the order
-            order = self.client.create_order(**order_params)
+            order = self._submit_order(**self._order_params(symbol, side, size, price, order_type))
 
             # Log successful order
             self.successful_orders.append(order)
-            self.telegram.send_telegram_message(f"Order placed successfully:\n{order}")
+            self._notify(f"Order placed successfully:\n{order}")
 
         except BinanceAPIException as e:
-            self.failed_orders.append({
-                'symbol': symbol,
-                'side': side,
-                'size': size,
-                'price': price,
-                'error': str(e)
-            })
-            self.telegram.send_telegram_message(f"Failed to place order:\nSymbol: {symbol}, Side: {side}, Error: {e}")
+            self._log_failed_order(symbol, side, size, price, e)
     
+    def _quantize_to_filters(self, symbol: str, quantity: float, price: float = None) -> tuple:
+        """
+        Rounds quantity down to the symbol's step size and price down to its tick size, as Decimals.
+        """
+        filters = self._get_symbol_filters(symbol)
+        step_dec = filters['stepDec']
+        tick_dec = filters['tickDec']
+        quantity = (Decimal(str(quantity)) // step_dec * step_dec).quantize(step_dec)
+        if price:
+            price = (Decimal(str(price)) // tick_dec * tick_dec).quantize(tick_dec)
+        return quantity, price
+
+    def _round_to_filters(self, symbol: str, quantity: float, price: float = None) -> tuple:
+        """
+        `_quantize_to_filters` as floats.
+        """
+        quantity, price = self._quantize_to_filters(symbol, quantity, price)
+        return float(quantity), float(price) if price is not None else None
+
+    def _filter_strings(self, symbol: str, quantity: float, price: float = None) -> tuple:
+        """
+        `_quantize_to_filters` as plain decimal strings for the request, str() of a small float would be
+        in scientific notation (5e-06). Price is None when not given or rounded to zero.
+        """
+        quantity, price = self._quantize_to_filters(symbol, quantity, price)
+        return format(quantity, 'f'), format(price, 'f') if price else None
+
+    def _batch_order_outcome(self, order: dict, error: Exception) -> dict:
+        """
+        The order as Binance has it after a batch request with an unknown outcome, or an error response.
+        A missing order is looked up once more after a backoff, an in-flight one may not be visible yet.
+        """
+        for attempt in range(2):
+            if attempt:
+                time.sleep(_backoff(attempt))
+            try:
+                placed = self._find_order(True, order['symbol'], order['newClientOrderId'])
+            except Exception as lookup_error:
+                return {'code': None, 'msg': f"Status unknown after {error}, lookup failed: {lookup_error}"}
+            if placed is not None:
+                return placed
+        return {'code': None, 'msg': f"Not placed: {error}"}
+
+    def iterate_futures_orders_df(self, orders: pd.DataFrame, order_type: str = 'MARKET') -> tuple[list, list]:
+        """
+        Places Futures orders through /fapi/v1/batchOrders, up to FUTURES_BATCH_SIZE orders per signed request.
+
+        Args:
+            orders (pd.DataFrame): Orders with Symbol, Side, Size (contracts) and Price columns.
+            order_type (str, optional): 'MARKET' or 'LIMIT' for every order. Default is 'MARKET'.
+
+        Returns:
+            tuple: successful_orders, failed_orders
+        """
+        if orders.empty:
+            return [], []
+
+        self._ensure_futures()
+        orders = orders.astype({'Size': 'float64', 'Price': 'float64'}, copy=False)
+        batch_orders = []
+        for symbol, side, size, price in zip(
+            orders['Symbol'].to_numpy(),
+            orders['Side'].to_numpy(),
+            orders['Size'].to_numpy().tolist(),
+            orders['Price'].to_numpy().tolist()
+        ):
+            quantity, price = self._filter_strings(symbol, size, price if order_type.upper() == 'LIMIT' else None)
+            batch_orders.append(self._order_params(symbol, side, quantity, price, order_type))
+
+        for start in range(0, len(batch_orders), FUTURES_BATCH_SIZE):
+            batch = batch_orders[start:start + FUTURES_BATCH_SIZE]
+            try:
+                responses = _call_order_api(self.client.futures_place_batch_order, batchOrders=batch)
+            except Exception as e:
+                if _outcome_unknown(e):
+                    # Some of the batch may have executed, book each order by what Binance has, never resend
+                    time.sleep(_backoff(0))  # Give in-flight orders time to show up before looking for them
+                    responses = [self._batch_order_outcome(order, e) for order in batch]
+                elif isinstance(e, BinanceAPIException):
+                    responses = [{'code': e.code, 'msg': e.message}] * len(batch)
+                else:
+                    raise
+
+            # One response per order, failed ones carry an error code instead of the order
+            for order, response in zip(batch, responses):
+                if 'code' in response:
+                    self.failed_orders.append({
+                        'symbol': order['symbol'],
+                        'side': order['side'],
+                        'quantity': order['quantity'],
+                        'price': order.get('price'),
+                        'error': response.get('msg'),
+                    })
+                    self._notify(f"Failed to place Futures order:\nSymbol: {order['symbol']}, Side: {order['side']}, Error: {response.get('msg')}")
+                else:
+                    self.successful_orders.append(response)
+                    self._notify(f"Futures Order placed successfully:\n{response}")
+
+        return self.successful_orders, self.failed_orders
+
     def place_futures_order(self, symbol: str, side: str, quantity: float, price: float = None, order_type: str = 'MARKET', quantity_type: str = 'CONTRACTS'):
         try:
-            # Fetch symbol information to get precision details
-            symbol_info = self.client.futures_exchange_info()
-            for info in symbol_info['symbols']:
-                if info['symbol'] == symbol.upper():
-                    step_size = float(info['filters'][2]['stepSize'])  # Quantity precision
-                    tick_size = float(info['filters'][0]['tickSize'])  # Price precision
-                    break
-            else:
-                raise ValueError(f"Symbol {symbol} not found in exchange info.")
-
+            self._ensure_futures()
             if quantity_type.upper() == 'USD':
-                mark_price = float(self.client.futures_mark_price(symbol=symbol)['markPrice'])
+                mark_price = float(_call_api(self.client.futures_mark_price, symbol=symbol)['markPrice'])
                 quantity = quantity / mark_price  # Convert USD value to contracts
 
             # Round quantity and price to allowed precision
-            quantity = round(quantity // step_size * step_size, int(-1 * round(math.log10(step_size))))
-            if price:
-                price = round(price // tick_size * tick_size, int(-1 * round(math.log10(tick_size))))
+            quantity, price = self._filter_strings(symbol, quantity, price)
             
             # Prepare order parameters for Futures
-            params = {
-                'symbol': symbol.upper(),
-                'side': side.upper(),
-                'type': order_type.upper(),
-                'quantity': quantity,
-            }
-            if order_type.upper() == 'LIMIT':
-                params['price'] = price
-                params['timeInForce'] = 'GTC'
+            params = self._order_params(symbol, side, quantity, price, order_type)
 
             # Place the Futures order
-            order = self.client.futures_create_order(**params)
+            order = self._submit_order(futures=True, **params)
 
             # Log success
             self.successful_orders.append(order)
-            self.telegram.send_telegram_message(f"Futures Order placed successfully:\n{order}")
+            self._notify(f"Futures Order placed successfully:\n{order}")
             return order
         
         except BinanceAPIException as e:
@@ -126,7 +896,7 @@ class Binance(OMS):
                 'price': price,
                 'error': str(e),
             })
-            self.telegram.send_telegram_message(f"Failed to place Futures order:\nSymbol: {symbol}, Side: {side}, Error: {e}")
+            self._notify(f"Failed to place Futures order:\nSymbol: {symbol}, Side: {side}, Error: {e}")
             return None
     
     def change_leverage(self, symbol: str, leverage: int):
@@ -142,50 +912,112 @@ class Binance(OMS):
         """
         try:
             # Binance API call to change leverage
-            response = self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
-            self.telegram.send_telegram_message(f"Leverage changed successfully for {symbol} to {leverage}x:\n{response}")
+            response = _call_api(self.client.futures_change_leverage, symbol=symbol, leverage=leverage)
+            self._notify(f"Leverage changed successfully for {symbol} to {leverage}x:\n{response}")
             return response
         except BinanceAPIException as e:
-            self.telegram.send_telegram_message(f"Failed to change leverage for {symbol} to {leverage}x: {e}")
+            self._notify(f"Failed to change leverage for {symbol} to {leverage}x: {e}")
             return None
 
     def cancel_order(self, symbol: str, order_id: str):
         try:
-            result = self.client.cancel_order(symbol=symbol, orderId=order_id)
-            self.telegram.send_telegram_message(f"Order canceled successfully: {result}")
+            result = _call_api(self.client.cancel_order, symbol=symbol, orderId=order_id)
+            self._notify(f"Order canceled successfully: {result}")
         except BinanceAPIException as e:
-            self.telegram.send_telegram_message(f"Failed to cancel order:\nSymbol: {symbol}, Order ID: {order_id}, Error: {e}")
+            self._notify(f"Failed to cancel order:\nSymbol: {symbol}, Order ID: {order_id}, Error: {e}")
 
     def cancel_all_orders(self, symbol: str):
         try:
-            result = self.client.cancel_open_orders(symbol=symbol)
-            self.telegram.send_telegram_message(f"All orders canceled successfully for {symbol}: {result}")
+            result = _call_api(self.client.cancel_open_orders, symbol=symbol)
+            self._notify(f"All orders canceled successfully for {symbol}: {result}")
         except BinanceAPIException as e:
-            self.telegram.send_telegram_message(f"Failed to cancel all orders for {symbol}: {e}")
+            self._notify(f"Failed to cancel all orders for {symbol}: {e}")
 
     def get_positions(self):
         try:
-            positions = self.client.get_account()['balances']
-            positions_df = pd.DataFrame(positions)
-            positions_df = positions_df[positions_df['free'].astype(float) > 0]
-            return positions_df
+            # Most of the ~2000 listed assets have zero balance, drop them before building the frame
+            positions = [
+                balance for balance in _call_api(self.client.get_account)['balances']
+                if float(balance['free']) > 0 or float(balance['locked']) > 0
+            ]
+            return pd.DataFrame(positions, columns=['asset', 'free', 'locked'])
         except BinanceAPIException as e:
-            self.telegram.send_telegram_message(f"Failed to fetch positions: {e}")
+            self._notify(f"Failed to fetch positions: {e}")
 
     def get_account_summary(self):
         try:
-            account_info = self.client.get_account()
+            account_info = _call_api(self.client.get_account)
             return account_info
         except BinanceAPIException as e:
-            self.telegram.send_telegram_message(f"Failed to fetch account summary: {e}")
+            self._notify(f"Failed to fetch account summary: {e}")
 
     def get_available_balance(self, asset: str):
         try:
-            account_info = self.client.get_asset_balance(asset=asset)
+            account_info = _call_api(self.client.get_asset_balance, asset=asset)
             return account_info
         except BinanceAPIException as e:
-            self.telegram.send_telegram_message(f"Failed to fetch available balance for {asset}: {e}")
+            self._notify(f"Failed to fetch available balance for {asset}: {e}")
     
+    def _mark_prices(self, positions: list) -> dict:
+        """
+        symbol -> mark price for the open positions in `positions`, in at most one API call.
+        Uses the positions' own markPrice when the payload carries it.
+        """
+        open_positions = [pos for pos in positions if float(pos['positionAmt']) != 0]
+        if all('markPrice' in pos for pos in open_positions):
+            return {pos['symbol']: float(pos['markPrice']) for pos in open_positions}
+
+        if len(open_positions) == 1:
+            symbol = open_positions[0]['symbol']
+            return {symbol: float(_call_api(self.client.futures_mark_price, symbol=symbol)['markPrice'])}
+
+        # Without a symbol the endpoint returns every mark price at once
+        return {m['symbol']: float(m['markPrice']) for m in _call_api(self.client.futures_mark_price)}
+
+    def _close_position(self, symbol: str, side: str, close_quantity: float, position_amt: float,
+                        notional_value: float) -> tuple:
+        """
+        Sends one reduceOnly market close, called from the close_futures_positions worker pool.
+
+        Returns:
+            tuple: ('closed', order), ('unclosable', details) or ('failed', details).
+        """
+        try:
+            if close_quantity > abs(position_amt):
+                print(f"Close quantity exceeds open position size for {symbol}.")
+
+            # No local minNotional check, Binance waives it for reduceOnly orders
+            # ("notional must be no smaller than X (unless you choose reduce only)")
+            min_notional = self._get_symbol_filters(symbol)['minNotional']
+
+            self._order_rate_limiter.acquire()
+            quantity, _ = self._filter_strings(symbol, close_quantity)
+            order = self._submit_order(futures=True,
+                symbol=symbol,
+                side=side,
+                type="MARKET",
+                quantity=quantity,
+                reduceOnly=True
+            )
+            msg_prefix = "Closed small position" if notional_value < min_notional else "Closed position"
+            self._notify(f"{msg_prefix} for {symbol}: {order}")
+            return 'closed', order
+
+        except BinanceAPIException as e:
+            if "notional must be no smaller than 5" in str(e):
+                self._notify(
+                    f"Unclosable position for {symbol}: Notional value (${notional_value}) too small to close."
+                )
+                return 'unclosable', {
+                    'symbol': symbol,
+                    'notional': notional_value,
+                    'error': "Notional value too small to close."
+                }
+            self._notify(
+                f"Failed to close position for {symbol}: {e}"
+            )
+            return 'failed', {'symbol': symbol, 'error': str(e)}
+
     def close_futures_positions(self, symbol: str = None, quantity: float = None, quantity_type: str = 'CONTRACTS', percentage: float = None,
                                  use_chaser: bool = False, chaser_params: dict = None):
         """
@@ -205,7 +1037,8 @@ class Binance(OMS):
         """
         try:
             # Fetch account positions
-            account_info = self.client.futures_account()
+            account_info = _call_api(self.client.futures_account)
+            self._futures_verified = True  # Same call _ensure_futures makes
             positions = account_info['positions']
 
             successful_closes = []
@@ -215,6 +1048,8 @@ class Binance(OMS):
             # Filter positions if a specific symbol is provided
             if symbol:
                 positions = [pos for pos in positions if pos['symbol'] == symbol.upper()]
+            mark_prices = self._mark_prices(positions)
+            close_jobs = []
 
             for position in positions:
                 position_amt = float(position['positionAmt'])
@@ -222,7 +1057,7 @@ class Binance(OMS):
                     continue
 
                 symbol = position['symbol']
-                mark_price = float(self.client.futures_mark_price(symbol=symbol)['markPrice'])
+                mark_price = mark_prices[symbol]
                 notional_value = abs(position_amt * mark_price)
 
                 side = "SELL" if position_amt > 0 else "BUY"  # Opposite side to close position
@@ -250,74 +1085,50 @@ class Binance(OMS):
                         })
 
                         self.limit_order_chaser_async(**chaser_params)
-                        self.telegram.send_telegram_message(f"Started limit order chaser for {symbol}.")
+                        self._notify(f"Started limit order chaser for {symbol}.")
                     except Exception as e:
                         failed_closes.append({'symbol': symbol, 'error': str(e)})
-                        self.telegram.send_telegram_message(
+                        self._notify(
                             f"Failed to start limit order chaser for {symbol}: {e}"
                         )
                         continue
                 else:
-                    try:
-                        if close_quantity > abs(position_amt):
-                            print(f"Close quantity exceeds open position size for {symbol}.")
-                        if notional_value < 5:
-                            # Use reduceOnly for small positions
-                            order = self.client.futures_create_order(
-                                symbol=symbol,
-                                side=side,
-                                type="MARKET",
-                                quantity=close_quantity,
-                                reduceOnly=True
-                            )
-                            self.telegram.send_telegram_message(
-                                f"Closed small position for {symbol} using reduceOnly: {order}"
-                            )
-                        else:
-                            # Standard close for larger positions
-                            order = self.client.futures_create_order(
-                                symbol=symbol,
-                                side=side,
-                                type="MARKET",
-                                quantity=close_quantity,
-                                reduceOnly=True
-                            )
-                            self.telegram.send_telegram_message(
-                                f"Closed position for {symbol}: {order}"
-                            )
-
-                        successful_closes.append(order)
+                    close_jobs.append((symbol, side, close_quantity, position_amt, notional_value))
 
-                    except BinanceAPIException as e:
-                        if "notional must be no smaller than 5" in str(e):
-                            unclosable_positions.append({
-                                'symbol': symbol,
-                                'notional': notional_value,
-                                'error': "Notional value too small to close."
-                            })
-                            self.telegram.send_telegram_message(
-                                f"Unclosable position for {symbol}: Notional value (${notional_value}) too small to close."
-                            )
-                        else:
-                            failed_closes.append({'symbol': symbol, 'error': str(e)})
-                            self.telegram.send_telegram_message(
-                                f"Failed to close position for {symbol}: {e}"
-                            )
-
-                # Log unclosable positions
-                if unclosable_positions:
-                    self.telegram.send_telegram_message(
-                        f"Unclosable positions:\n{unclosable_positions}"
-                    )
+            # Closes are independent per symbol, send them concurrently within the order rate limit
+            if close_jobs:
+                outcomes = {'closed': successful_closes, 'failed': failed_closes, 'unclosable': unclosable_positions}
+                with ThreadPoolExecutor(max_workers=CLOSE_POSITION_WORKERS) as executor:
+                    futures = {executor.submit(self._close_position, *job): job[0] for job in close_jobs}
+                    for future in as_completed(futures):
+                        try:
+                            outcome, record = future.result()
+                        except Exception as e:  # Unknown symbol, network errors after retries, unknown order status
+                            self._notify(f"Failed to close position for {futures[future]}: {e}")
+                            outcome, record = 'failed', {'symbol': futures[future], 'error': str(e)}
+                        outcomes[outcome].append(record)
+
+            # Log unclosable positions
+            if unclosable_positions:
+                self._notify(
+                    f"Unclosable positions:\n{unclosable_positions}"
+                )
 
             return successful_closes, failed_closes, unclosable_positions
 
         except BinanceAPIException as e:
-            self.telegram.send_telegram_message(f"Failed to fetch positions: {e}")
+            self._notify(f"Failed to fetch positions: {e}")
             return None, None, None
 
     
-    def view_open_futures_positions(self):
+    @staticmethod
+    def style_positions(positions_df: pd.DataFrame):
+        """
+        Display formatting for `view_open_futures_positions(formatted=False)`, numbers stay numbers underneath.
+        """
+        return positions_df.style.format(POSITION_DISPLAY_FORMATS, na_rep="N/A")
+
+    def view_open_futures_positions(self, formatted: bool = True):
         """
         Fetches and displays open Futures positions with detailed information:
         - Symbol
@@ -325,58 +1136,48 @@ class Binance(OMS):
         - PNL (Unrealized)
         - Leverage
         - Liquidation Price
+
+        Args:
+            formatted (bool, optional): Render prices as "$1,234.56" strings and leverage as "10x".
+                                        Pass False to keep numeric columns, e.g. with `style_positions`.
         
         Returns:
             pd.DataFrame: A well-formatted DataFrame with open position details.
         """
         try:
             # Fetch account details to get positions
-            account_info = self.client.futures_account()
+            account_info = _call_api(self.client.futures_account)
+            self._futures_verified = True  # Same call _ensure_futures makes
             positions = account_info['positions']
-            
-            # Prepare data for open positions
-            position_data = []
-            for position in positions:
-                position_amt = float(position['positionAmt'])
-                if position_amt != 0:  # Only include open positions
-                    symbol = position['symbol']
-                    entry_price = float(position['entryPrice'])
-                    leverage = int(position['leverage'])
-                    mark_price = float(self.client.futures_mark_price(symbol=symbol)['markPrice'])
-                    notional_value = abs(position_amt * mark_price)  # Size in USD
-                    pnl = float(position['unrealizedProfit'])  # Unrealized PNL
-
-                    # Handle missing liquidation price
-                    liquidation_price = position.get('liquidationPrice', None)
-                    if liquidation_price:
-                        liquidation_price = float(liquidation_price)
-                        liquidation_price_str = f"${liquidation_price:,.2f}"
-                    else:
-                        liquidation_price_str = "N/A"
-
-                    position_data.append({
-                        'Symbol': symbol,
-                        'Size (Contracts)': position_amt,
-                        'Size (USD)': f"${notional_value:,.2f}",
-                        'Entry Price': f"${entry_price:,.2f}",
-                        'Mark Price': f"${mark_price:,.2f}",
-                        'PNL (Unrealized)': f"${pnl:,.2f}",
-                        'Liquidation Price': liquidation_price_str,
-                        'Leverage': f"{leverage}x"
-                    })
+            mark_prices = self._mark_prices(positions)
 
-            # Convert data to a DataFrame
-            if position_data:
-                positions_df = pd.DataFrame(position_data)
-            else:
-                positions_df = pd.DataFrame(columns=['Symbol', 'Size (Contracts)', 'Size (USD)', 'Entry Price',
-                                                    'Mark Price', 'PNL (Unrealized)', 'Liquidation Price', 'Leverage'])
-            
-            # Format the output nicely
+            positions_df = pd.DataFrame(positions, columns=['symbol', 'positionAmt', 'entryPrice', 'leverage',
+                                                            'unrealizedProfit', 'liquidationPrice'])
+            position_amt = positions_df['positionAmt'].astype(float)
+            open_mask = position_amt != 0  # Only include open positions
+            positions_df = positions_df[open_mask]
+            position_amt = position_amt[open_mask]
+            mark_price = positions_df['symbol'].map(mark_prices).astype(float)
+
+            positions_df = pd.DataFrame({
+                'Symbol': positions_df['symbol'],
+                'Size (Contracts)': position_amt,
+                'Size (USD)': position_amt.abs() * mark_price,
+                'Entry Price': positions_df['entryPrice'].astype(float),
+                'Mark Price': mark_price,
+                'PNL (Unrealized)': positions_df['unrealizedProfit'].astype(float),
+                # Missing liquidation prices become NaN, rendered as "N/A"
+                'Liquidation Price': pd.to_numeric(positions_df['liquidationPrice'], errors='coerce'),
+                'Leverage': positions_df['leverage'].astype(int),
+            }).reset_index(drop=True)
+
+            if formatted:
+                for column, fmt in POSITION_DISPLAY_FORMATS.items():
+                    positions_df[column] = positions_df[column].map(lambda v: fmt.format(v) if pd.notna(v) else "N/A")
             return positions_df
 
         except BinanceAPIException as e:
-            self.telegram.send_telegram_message(f"Failed to fetch open futures positions: {e}")
+            self._notify(f"Failed to fetch open futures positions: {e}")
             return pd.DataFrame()  # Return an empty DataFrame in case of failure
 
     def limit_order_chaser(
@@ -398,16 +1199,8 @@ class Binance(OMS):
         try:
             side = side.upper()
             # Fetch precision details for the symbol
-            exchange_info = self.client.futures_exchange_info()
-            symbol_info = next(
-                (info for info in exchange_info["symbols"] if info["symbol"] == symbol.upper()), None
-            )
-            if not symbol_info:
-                raise ValueError(f"Symbol {symbol} not found in exchange info.")
-            
-            # Extract precision values
-            tick_size = float(symbol_info["filters"][0]["tickSize"])  # Price precision
-            step_size = float(symbol_info["filters"][2]["stepSize"])  # Quantity precision
+            filters = self._get_symbol_filters(symbol)
+            tick_size = filters["tickSize"]  # Price precision
 
             retries = 0
             order_id = None
@@ -419,12 +1212,12 @@ class Binance(OMS):
                     try:
                         self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
                     except BinanceAPIException as e:
-                        self.telegram.send_telegram_message(
+                        self._notify(
                             f"Failed to cancel previous order: {e}"
                         )
                         order_status = self.client.futures_get_order(symbol=symbol, orderId=order_id)
                         if order_status["status"] == "FILLED":
-                            self.telegram.send_telegram_message(f"Failed because Order was filled: {order_status}")
+                            self._notify(f"Failed because Order was filled: {order_status}")
                             return order_status
 
                 # Fetch the order book
@@ -439,15 +1232,16 @@ class Binance(OMS):
                     target_price = best_bid + tick_size  # Slightly above best bid
 
                 # Round to the appropriate price precision
-                target_price = round(target_price, int(-1 * round(math.log10(tick_size))))
+                target_price = round(target_price, filters["tickPrecision"])
                 
                 # Round size to quantity precision
-                size = round(size // step_size * step_size, int(-1 * round(math.log10(step_size))))
+                size, _ = self._round_to_filters(symbol, size)
 
 
                 # Place the new limit order with Post-Only (GTX)
                 try:
-                    order = self.client.futures_create_order(
+                    order = self._create_order(
+                        futures=True,
                         symbol=symbol.upper(),
                         side=side,
                         type="LIMIT",
@@ -458,15 +1252,15 @@ class Binance(OMS):
                     )
                     order_id = order["orderId"]
                     print(f'OrderId : {order_id}')
-                    self.telegram.send_telegram_message(f"Placed limit order: {order}")
+                    self._notify(f"Placed limit order: {order}")
                 except BinanceAPIException as e:
                     # Handle Post-Only rejection gracefully
                     if "Post Only order will be rejected" in str(e):
-                        self.telegram.send_telegram_message(
+                        self._notify(
                             f"Post-Only order rejected. Adjusting price and retrying... {e}"
                         )
                     else:
-                        self.telegram.send_telegram_message(
+                        self._notify(
                             f"Failed to place limit order: {e}. Retrying..."
                         )
                     retries += 1
@@ -478,7 +1272,7 @@ class Binance(OMS):
                 # Check order status
                 order_status = self.client.futures_get_order(symbol=symbol, orderId=order_id)
                 if order_status["status"] == "FILLED":
-                    self.telegram.send_telegram_message(f"Order filled: {order_status}")
+                    self._notify(f"Order filled: {order_status}")
                     return order_status
 
                 retries += 1
@@ -486,13 +1280,13 @@ class Binance(OMS):
             # If the order was not filled after retries, cancel the last order
             if order_id:
                 self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
-                self.telegram.send_telegram_message(
+                self._notify(
                     f"Failed to fill limit order after {max_retries} retries. Order canceled."
                 )
             return None
 
         except BinanceAPIException as e:
-            self.telegram.send_telegram_message(f"Error during limit order chasing: {e}")
+            self._notify(f"Error during limit order chasing: {e}")
             return None
     
     def limit_order_chaser_async(self, *args, **kwargs):
@@ -506,7 +1300,7 @@ class Binance(OMS):
     # Add this to your Binance class in binance_oms.py
     def get_futures_balance(self, asset: str = 'USDT'):
         try:
-            futures_account = self.client.futures_account()
+            futures_account = _call_api(self.client.futures_account)
             balances = futures_account['assets']
             for balance in balances:
                 if balance['asset'] == asset:
@@ -517,7 +1311,7 @@ class Binance(OMS):
                     }
             raise ValueError(f"{asset} balance not found in futures account")
         except BinanceAPIException as e:
-            self.telegram.send_telegram_message(f"Failed to fetch futures balance: {e}")
+            self._notify(f"Failed to fetch futures balance: {e}")
             return None
     
 
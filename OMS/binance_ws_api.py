@@ -0,0 +1,167 @@
+'''
+Usage :
+from OMS.binance_ws_api import BinanceWsApi, FUTURES_WS_API_URL
+
+ws_api = BinanceWsApi(api_key, api_secret, url=FUTURES_WS_API_URL)
+order = ws_api.request("order.place", {"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "quantity": 0.001})
+'''
+import hashlib
+import hmac
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from decimal import Decimal
+from urllib.parse import urlencode
+import websocket
+from binance.exceptions import BinanceAPIException
+
+SPOT_WS_API_URL = "wss://ws-api.binance.com:443/ws-api/v3"
+FUTURES_WS_API_URL = "wss://ws-fapi.binance.com/ws-fapi/v1"
+RECONNECT_COOLDOWN = 30.0  # Seconds before reconnecting after a failed connect, orders go over REST meanwhile
+
+class RequestStatusUnknown(Exception):
+    """
+    The request was sent but its response never arrived (connection lost or timed out), so whether
+    it executed is unknown. Not safe to resend an order on, look it up first.
+    """
+
+def _format_value(value):
+    # Same text goes into the signature payload and the request, floats must not be in scientific notation
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return format(Decimal(repr(value)), "f")
+    return value
+
+class BinanceWsApi:
+    """
+    Signed requests over a persistent Binance WebSocket API connection, so each order skips the
+    TCP/TLS handshake and HTTP framing of a REST call. Responses are matched to requests by id.
+
+    Exchange rejections raise BinanceAPIException like the REST client does. ConnectionError means the
+    request never left, so the caller can safely fall back to REST. RequestStatusUnknown means it left
+    and no response came back.
+    """
+
+    def __init__(self, api_key: str, api_secret: str, url: str = FUTURES_WS_API_URL, timeout: float = 10.0):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.url = url
+        self.timeout = timeout
+        self.timestamp_offset = 0  # Server time minus local time (ms), kept current by the owner
+
+        self._ws = None
+        self._connected = threading.Event()
+        self._settled = threading.Event()  # Set once the connect attempt opened or failed
+        self._retry_after = 0.0
+        self._lock = threading.Lock()
+        self._pending = {}  # request id -> Future
+
+    def connect(self):
+        with self._lock:
+            # Callers racing here share one socket, the others just wait for it to open
+            if self._ws is None:
+                remaining = self._retry_after - time.monotonic()
+                if remaining > 0:
+                    raise ConnectionError(f"{self.url} unreachable, retrying in {remaining:.0f}s")
+                self._connected.clear()
+                self._settled.clear()
+                self._ws = websocket.WebSocketApp(
+                    self.url,
+                    on_open=self._on_open,
+                    on_message=self._on_message,
+                    on_error=self._on_error,
+                    on_close=self._on_close,
+                )
+                threading.Thread(target=self._ws.run_forever, daemon=True).start()
+        # An unreachable endpoint errors out right away, don't sit through the whole timeout
+        self._settled.wait(self.timeout)
+        if not self._connected.is_set():
+            self.close()
+            with self._lock:
+                self._retry_after = time.monotonic() + RECONNECT_COOLDOWN
+            raise ConnectionError(f"Failed to connect to {self.url}")
+
+    def close(self):
+        with self._lock:
+            ws, self._ws = self._ws, None
+        self._connected.clear()
+        if ws:
+            ws.close()
+
+    def _on_open(self, ws):
+        self._connected.set()
+        self._settled.set()
+
+    def _on_message(self, ws, message):
+        data = json.loads(message)
+        with self._lock:
+            future = self._pending.pop(data.get('id'), None)
+        if future is None:
+            return
+        if data.get('status') == 200:
+            future.set_result(data['result'])
+        else:
+            future.set_exception(BinanceAPIException(None, data.get('status'), json.dumps(data.get('error', {}))))
+
+    def _on_error(self, ws, error):
+        print(f"Binance WS API error: {error}")
+        with self._lock:
+            if self._ws is ws:
+                self._settled.set()
+
+    def _on_close(self, ws, close_status_code, close_msg):
+        # Whatever was in flight is lost with the connection, the order status is unknown
+        with self._lock:
+            if self._ws is ws:
+                self._ws = None
+                self._connected.clear()
+                self._settled.set()
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(RequestStatusUnknown(f"Connection closed before a response: {close_status_code} {close_msg}"))
+
+    def _sign(self, params: dict) -> dict:
+        params = {key: _format_value(value) for key, value in params.items() if value is not None}
+        params['apiKey'] = self.api_key
+        params['timestamp'] = int(time.time() * 1000 + self.timestamp_offset)
+        payload = urlencode(sorted(params.items()))
+        params['signature'] = hmac.new(self.api_secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
+        return params
+
+    def request(self, method: str, params: dict, signed: bool = True):
+        """
+        Sends `method` with `params` and blocks until its response arrives.
+
+        Returns:
+            The `result` of the response, e.g. the order for `order.place`.
+        """
+        if not self._connected.is_set():
+            self.connect()
+
+        request_id = uuid.uuid4().hex
+        params = self._sign(params) if signed else {key: _format_value(value) for key, value in params.items()}
+        future = Future()
+        with self._lock:
+            ws = self._ws
+            self._pending[request_id] = future
+        try:
+            if ws is None:
+                raise websocket.WebSocketConnectionClosedException("Connection is already closed.")
+            ws.send(json.dumps({'id': request_id, 'method': method, 'params': params}))
+        except websocket.WebSocketException as e:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            if ws is not None:
+                self.close()  # Broken socket, the next request reconnects
+            raise ConnectionError(f"Failed to send {method}: {e}") from e
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise RequestStatusUnknown(f"No response to {method} within {self.timeout}s") from None
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import vectorbtpro as vbt
 from pandas.tseries.frequencies import to_offset
@@ -37,6 +38,8 @@ class Backtester:
         allow_partial: bool,
         progress_callback: Callable[[int, str], None],
         pair: Optional[str] = None,
+        ohlcv_data: Optional[Dict[str, pd.DataFrame]] = None,
+        use_float32: bool = False,
     ) -> None:
         """
         Initialize the Backtester with the given parameters.
@@ -57,6 +60,8 @@ class Backtester:
             allow_partial (bool): Allow partial orders.
             progress_callback (Callable[[int, str], None]): Callback for progress updates.
             pair (Optional[str]): The trading pair, e.g., 'USDT', 'BTC' (for crypto).
+            ohlcv_data (Optional[Dict[str, pd.DataFrame]]): Preloaded OHLCV data keyed by symbol. Skips the Finstore read when provided.
+            use_float32 (bool): Downcast prices to float32 before signal generation and simulation. Halves memory traffic at reduced precision.
         """
         self.market_name = market_name
         self.symbol_list = symbol_list
@@ -73,6 +78,8 @@ class Backtester:
         self.cash_sharing = cash_sharing
         self.allow_partial = allow_partial
         self.progress_callback = progress_callback
+        self.ohlcv_data = ohlcv_data
+        self.use_float32 = use_float32
 
         self.portfolio = self.backtest()
 
@@ -85,9 +92,14 @@ class Backtester:
         """
         self.progress_callback(0, "Fetching data...")
         ohlcv_data = self.data_fetch()
+        if self.use_float32:
+            ohlcv_data = {symbol: self._downcast_prices(df) for symbol, df in ohlcv_data.items()}
 
         self.progress_callback(25, "Running strategy...")
         entries, exits, close_data, open_data = self.strategy_object.run(ohlcv_data)
+        if self.use_float32:
+            close_data = close_data.astype(np.float32, copy=False)
+            open_data = open_data.astype(np.float32, copy=False)
 
         self.progress_callback(50, "Simulating portfolio...")
         pf = vbt.Portfolio.from_signals(
@@ -120,6 +132,11 @@ class Backtester:
         Returns:
             pd.DataFrame: The fetched OHLCV data.
         """
+        if self.ohlcv_data:
+            self.progress_callback(5, "Using preloaded data...")
+            self._validate_data_dates(self.ohlcv_data)
+            return self.ohlcv_data
+
         finstore = Finstore(market_name=self.market_name, timeframe=self.timeframe, pair=self.pair)
         ohlcv_dict = {}
         try:
@@ -141,6 +158,14 @@ class Backtester:
 
         return ohlcv_dict
 
+    @staticmethod
+    def _downcast_prices(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast the float64 price/volume columns of an OHLCV DataFrame to float32.
+        """
+        float_columns = df.select_dtypes(include='float64').columns
+        return df.astype({column: np.float32 for column in float_columns})
+
     def _validate_data_dates(self, ohlcv_dict: pd.DataFrame) -> None:
         """
         Validate that each symbol's data covers the required date range.
@@ -233,6 +258,7 @@ class Backtester:
             "size": self.size,
             "cash_sharing": self.cash_sharing,
             "allow_partial": self.allow_partial,
+            "use_float32": self.use_float32,
             "strategy_params": self.strategy_object.params,
             "performance": {
                 "returns": float(pf.total_return),
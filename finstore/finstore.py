@@ -1,7 +1,7 @@
 import duckdb
 import os
 import pandas as pd
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import concurrent.futures
 from tqdm import tqdm
 import os
@@ -100,20 +100,23 @@ class Finstore:
 
             return symbol, merged_df
 
-        def symbol_list(self, symbol_list : list, merged_dataframe : bool = False):
+        def symbol_list(self, symbol_list : list, merged_dataframe : bool = False, max_workers : int = 16):
             
             """
             Reads the Parquet files for all given symbols in parallel and returns a dictionary with the results.
+            Reads are IO bound and DuckDB releases the GIL, so threads are used to avoid pickling every DataFrame back from a worker process.
 
             Args:
                 symbol_list (list): List of symbols to read data for.
+                merged_dataframe (bool): Read the ohlcv data merged with technical indicators.
+                max_workers (int): Maximum number of concurrent reads.
 
             Returns:
                 dict: A dictionary with symbols as keys and their corresponding DataFrames as values.
             """
             
             results = {}
-            with ProcessPoolExecutor() as executor:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 if merged_dataframe:
                     futures = {executor.submit(self.merged_df, symbol): symbol for symbol in symbol_list}
                 else:
@@ -2,6 +2,7 @@ from strategy.strategy_builder import StrategyBaseClass
 import pandas as pd
 pd.set_option('future.no_silent_downcasting', True)
 from typing import Callable, Optional, List, Tuple, Dict, Any
+from strategy.public.ema_strategy import ema_cross, ema_sweep, ema_sweep_pairs, _close_values
 
 class EMAStrategy(StrategyBaseClass):
     """
@@ -41,25 +42,20 @@ class EMAStrategy(StrategyBaseClass):
         close_dict = {}
         open_dict = {}
 
-        # Process each symbol's data individually
-        for symbol, df in ohlcv_data.items():
-            # Clean and prepare data
-            processed_df = self._preprocess_data(df)
-            
-            # Calculate indicators
-            close_series = processed_df['close']
-            fast_ema = calculate_ema(close_series, self.fast_ema_period)
-            slow_ema = calculate_ema(close_series, self.slow_ema_period)
-            
-            # Generate signals
-            entry_signals = (fast_ema > slow_ema) & (fast_ema.shift(1) <= slow_ema.shift(1))
-            exit_signals = (fast_ema < slow_ema) & (fast_ema.shift(1) >= slow_ema.shift(1))
-            
+        # Clean and prepare data
+        processed = {symbol: self._preprocess_data(df) for symbol, df in ohlcv_data.items()}
+
+        # Calculate indicators and signals for each group in one compiled pass
+        for index, symbols in self._index_groups(processed):
+            close = pd.DataFrame({symbol: processed[symbol]['close'] for symbol in symbols}, index=index)
+            entry_values, exit_values = ema_cross(_close_values(close), self.fast_ema_period, self.slow_ema_period)
+
             # Store results
-            entries_dict[symbol] = entry_signals.rename(symbol)
-            exits_dict[symbol] = exit_signals.rename(symbol)
-            close_dict[symbol] = close_series.rename(symbol)
-            open_dict[symbol] = processed_df['open'].rename(symbol)
+            for j, symbol in enumerate(symbols):
+                entries_dict[symbol] = pd.Series(entry_values[:, j], index=index, name=symbol)
+                exits_dict[symbol] = pd.Series(exit_values[:, j], index=index, name=symbol)
+                close_dict[symbol] = close[symbol]
+                open_dict[symbol] = processed[symbol]['open'].rename(symbol)
 
         # Create aligned DataFrames from individual series
         entries = pd.DataFrame(entries_dict)
@@ -73,6 +69,62 @@ class EMAStrategy(StrategyBaseClass):
 
         return entries, exits, close_prices, open_prices
 
+    def run_sweep(self, ohlcv_data: Dict[str, pd.DataFrame], fast_ema_periods: List[int],
+                  slow_ema_periods: List[int]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        EMA crossover signals for every (fast, slow) combination with fast < slow, each distinct
+        EMA period computed once per symbol and shared across the combinations using it.
+
+        Args:
+            ohlcv_data (Dict[str, pd.DataFrame]): Dictionary of OHLCV DataFrames keyed by symbol
+            fast_ema_periods (List[int]): Candidate periods for the fast EMA
+            slow_ema_periods (List[int]): Candidate periods for the slow EMA
+
+        Returns:
+            Same as `run`, with entries and exits columns keyed (fast_ema_period, slow_ema_period, symbol)
+        """
+        pairs = ema_sweep_pairs(fast_ema_periods, slow_ema_periods)
+        fast_windows, slow_windows = zip(*pairs)
+        entries_dict = {}
+        exits_dict = {}
+        close_dict = {}
+        open_dict = {}
+
+        processed = {symbol: self._preprocess_data(df) for symbol, df in ohlcv_data.items()}
+        for index, symbols in self._index_groups(processed):
+            close = pd.DataFrame({symbol: processed[symbol]['close'] for symbol in symbols}, index=index)
+            # (pairs, time, symbols)
+            entry_values, exit_values = ema_sweep(_close_values(close), fast_windows, slow_windows)
+
+            for j, symbol in enumerate(symbols):
+                for p, (fast, slow) in enumerate(pairs):
+                    entries_dict[(fast, slow, symbol)] = pd.Series(entry_values[p, :, j], index=index)
+                    exits_dict[(fast, slow, symbol)] = pd.Series(exit_values[p, :, j], index=index)
+                close_dict[symbol] = close[symbol]
+                open_dict[symbol] = processed[symbol]['open'].rename(symbol)
+
+        columns = ['fast_ema_period', 'slow_ema_period', 'symbol']
+        entries = pd.DataFrame(entries_dict).fillna(False).astype(bool).rename_axis(columns=columns)
+        exits = pd.DataFrame(exits_dict).fillna(False).astype(bool).rename_axis(columns=columns)
+
+        return entries, exits, pd.DataFrame(close_dict), pd.DataFrame(open_dict)
+
+    @staticmethod
+    def _index_groups(processed: Dict[str, pd.DataFrame]) -> List[Tuple[pd.Index, List[str]]]:
+        """
+        Symbols grouped by identical timestamp index. Each symbol's EMAs must only see its own rows,
+        so symbols are run through the kernels per group instead of aligned first. Usually that is a single group.
+        """
+        groups = []
+        for symbol, df in processed.items():
+            for index, symbols in groups:
+                if index.equals(df.index):
+                    symbols.append(symbol)
+                    break
+            else:
+                groups.append((df.index, [symbol]))
+        return groups
+
     def _preprocess_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Prepare raw OHLCV data for analysis.
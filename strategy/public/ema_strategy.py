@@ -1,26 +1,17 @@
+import itertools
+import numpy as np
 import pandas as pd
 pd.set_option('future.no_silent_downcasting', True)
+from scipy.signal import lfilter
+from strategy.public.ema_strategy_nb import NUMBA_AVAILABLE, ema_cross_signals, ema_cross_sweep
 
 def calculate_ema(close_data, period):
     return close_data.ewm(span=period, adjust=False).mean()
 
-def get_ema_signals_wrapper(ohlcv_data: pd.DataFrame, 
-                symbol_list: list, 
-                fast_ema_period: int = 10, 
-                slow_ema_period: int = 100):
+def _close_open_frames(ohlcv_data: dict, symbol_list: list):
     """
-    Generates entry and exit signals based on EMA crossovers.
-    
-    Args:
-        ohlcv_data (pd.DataFrame): DataFrame containing OHLCV data for the symbols.
-        symbol_list (list): List of symbols to consider.
-        fast_ema_period (int): Period for the fast EMA. Default is 10.
-        slow_ema_period (int): Period for the slow EMA. Default is 100.
-    
-    Returns:
-        Tuple of DataFrames: entries, exits, close_data, open_data
+    Aligns per-symbol OHLCV DataFrames into close and open DataFrames (columns=symbols).
     """
-    
     # Convert input to a dictionary of DataFrames per symbol
     ohlcv_data = {symbol: ohlcv_data[symbol] for symbol in symbol_list if symbol in ohlcv_data}
     
@@ -47,19 +38,148 @@ def get_ema_signals_wrapper(ohlcv_data: pd.DataFrame,
         symbol: df['open']
         for symbol, df in ohlcv_data.items()
     })
+    return close_data, open_data
+
+def _close_values(close_data: pd.DataFrame) -> np.ndarray:
+    """
+    Contiguous close array for the EMA kernels, float32 only when every column already is.
+    """
+    dtype = np.float32 if (close_data.dtypes == np.float32).all() else np.float64
+    values = np.ascontiguousarray(close_data.values, dtype=dtype)
+    # Copy-on-write pandas hands out read-only views, the kernels are compiled for writable arrays only
+    return values if values.flags.writeable else values.copy()
+
+def _ewm_mean_lfilter(close: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Per-column `ewm(alpha=alpha, adjust=False).mean()` of a 2-D array through scipy's IIR filter,
+    used when Numba is unavailable.
+    Each column is filtered from its first valid row, seeded with that price.
+    Columns with gaps after their first price fall back to pandas, lfilter would propagate the NaN.
+    """
+    out = np.full(close.shape, np.nan)
+    valid = ~np.isnan(close)
+    has_data = valid.any(axis=0)
+    first_valid = valid.argmax(axis=0)
+
+    for start in np.unique(first_valid[has_data]):
+        cols = np.flatnonzero(has_data & (first_valid == start))
+        block = close[start:, cols].astype(np.float64)
+        gapped = np.isnan(block).any(axis=0)
+
+        x = block[:, ~gapped]
+        if x.shape[1]:
+            # First row copied rather than filtered so fast and slow EMAs start exactly equal, as in pandas
+            clean_cols = cols[~gapped]
+            out[start, clean_cols] = x[0]
+            out[start + 1:, clean_cols], _ = lfilter([alpha], [1.0, alpha - 1.0], x[1:], axis=0, zi=(1.0 - alpha) * x[:1])
+        for j in cols[gapped]:
+            out[:, j] = pd.Series(close[:, j], dtype=np.float64).ewm(alpha=alpha, adjust=False).mean().values
+    return out
+
+def _ema_cross_flags(fast_ema: np.ndarray, slow_ema: np.ndarray):
+    entries = np.zeros(fast_ema.shape, dtype=np.bool_)
+    exits = np.zeros(fast_ema.shape, dtype=np.bool_)
+    entries[1:] = (fast_ema[1:] > slow_ema[1:]) & (fast_ema[:-1] <= slow_ema[:-1])
+    exits[1:] = (fast_ema[1:] < slow_ema[1:]) & (fast_ema[:-1] >= slow_ema[:-1])
+    return entries, exits
+
+def _ema_cross_signals_lfilter(close: np.ndarray, fast: int, slow: int):
+    """
+    Same contract as `ema_cross_signals`, without Numba.
+    """
+    return _ema_cross_flags(
+        _ewm_mean_lfilter(close, 2.0 / (fast + 1.0)),
+        _ewm_mean_lfilter(close, 2.0 / (slow + 1.0))
+    )
+
+def _ema_cross_sweep_lfilter(close: np.ndarray, fast_windows, slow_windows):
+    """
+    Same contract as `ema_cross_sweep`, without Numba.
+    """
+    emas = {window: _ewm_mean_lfilter(close, 2.0 / (window + 1.0)) for window in set(fast_windows) | set(slow_windows)}
+    signals = [_ema_cross_flags(emas[fast], emas[slow]) for fast, slow in zip(fast_windows, slow_windows)]
+    return np.stack([entries for entries, _ in signals]), np.stack([exits for _, exits in signals])
+
+def ema_cross(close: np.ndarray, fast: int, slow: int):
+    """
+    `ema_cross_signals` on a 2-D close array, or its lfilter equivalent when Numba is unavailable.
+    """
+    kernel = ema_cross_signals if NUMBA_AVAILABLE else _ema_cross_signals_lfilter
+    return kernel(close, int(fast), int(slow))
+
+def ema_sweep(close: np.ndarray, fast_windows, slow_windows):
+    """
+    `ema_cross_sweep` on a 2-D close array, or its lfilter equivalent when Numba is unavailable.
+    """
+    sweep = ema_cross_sweep if NUMBA_AVAILABLE else _ema_cross_sweep_lfilter
+    return sweep(close, fast_windows, slow_windows)
+
+def ema_sweep_pairs(fast_ema_periods, slow_ema_periods) -> list:
+    """
+    Every (fast, slow) combination with fast < slow.
+    """
+    pairs = [(fast, slow) for fast, slow in itertools.product(fast_ema_periods, slow_ema_periods) if fast < slow]
+    if not pairs:
+        raise ValueError("No (fast, slow) combination with fast_ema_period < slow_ema_period.")
+    return pairs
+
+def get_ema_signals_wrapper(ohlcv_data: pd.DataFrame, 
+                symbol_list: list, 
+                fast_ema_period: int = 10, 
+                slow_ema_period: int = 100):
+    """
+    Generates entry and exit signals based on EMA crossovers.
+    
+    Args:
+        ohlcv_data (pd.DataFrame): DataFrame containing OHLCV data for the symbols.
+        symbol_list (list): List of symbols to consider.
+        fast_ema_period (int): Period for the fast EMA. Default is 10.
+        slow_ema_period (int): Period for the slow EMA. Default is 100.
+    
+    Returns:
+        Tuple of DataFrames: entries, exits, close_data, open_data
+    """
+    close_data, open_data = _close_open_frames(ohlcv_data, symbol_list)
     
-    # Calculate the fast and slow EMAs for each symbol
-    fast_ema = close_data.apply(lambda col: calculate_ema(col, fast_ema_period))
-    slow_ema = close_data.apply(lambda col: calculate_ema(col, slow_ema_period))
+    # Calculate the EMA crossovers for all symbols in a single compiled pass
+    entries_values, exits_values = ema_cross(_close_values(close_data), fast_ema_period, slow_ema_period)
+    
+    entries = pd.DataFrame(entries_values, index=close_data.index, columns=close_data.columns)
+    exits = pd.DataFrame(exits_values, index=close_data.index, columns=close_data.columns)
+    
+    return entries, exits, close_data, open_data
+
+def get_ema_sweep_signals_wrapper(ohlcv_data: pd.DataFrame, 
+                symbol_list: list, 
+                fast_ema_periods: list, 
+                slow_ema_periods: list):
+    """
+    Generates EMA crossover signals for every (fast, slow) combination with fast < slow.
+    Each distinct EMA period is computed once and shared across the combinations using it.
+    
+    Args:
+        ohlcv_data (pd.DataFrame): DataFrame containing OHLCV data for the symbols.
+        symbol_list (list): List of symbols to consider.
+        fast_ema_periods (list): Candidate periods for the fast EMA.
+        slow_ema_periods (list): Candidate periods for the slow EMA.
+    
+    Returns:
+        Tuple of DataFrames: entries, exits (columns=(fast_ema_period, slow_ema_period, symbol)), close_data, open_data
+    """
+    close_data, open_data = _close_open_frames(ohlcv_data, symbol_list)
     
-    # Generate entry signals (bullish crossover: fast EMA crosses above slow EMA)
-    entries = (fast_ema > slow_ema) & (fast_ema.shift(1) <= slow_ema.shift(1))
+    pairs = ema_sweep_pairs(fast_ema_periods, slow_ema_periods)
+    fast_windows, slow_windows = zip(*pairs)
     
-    # Generate exit signals (bearish crossover: fast EMA crosses below slow EMA)
-    exits = (fast_ema < slow_ema) & (fast_ema.shift(1) >= slow_ema.shift(1))
+    entries_values, exits_values = ema_sweep(_close_values(close_data), fast_windows, slow_windows)
     
-    # Fill NaN values and ensure boolean type
-    entries = entries.fillna(False).astype(bool)
-    exits = exits.fillna(False).astype(bool)
+    # (pairs, time, symbols) -> (time, pairs * symbols)
+    n_pairs, n_rows, n_cols = entries_values.shape
+    columns = pd.MultiIndex.from_tuples(
+        [(fast, slow, symbol) for fast, slow in pairs for symbol in close_data.columns],
+        names=['fast_ema_period', 'slow_ema_period', 'symbol']
+    )
+    entries = pd.DataFrame(entries_values.transpose(1, 0, 2).reshape(n_rows, n_pairs * n_cols), index=close_data.index, columns=columns)
+    exits = pd.DataFrame(exits_values.transpose(1, 0, 2).reshape(n_rows, n_pairs * n_cols), index=close_data.index, columns=columns)
     
-    return entries, exits, close_data, open_data
\ No newline at end of file
+    return entries, exits, close_data, open_data
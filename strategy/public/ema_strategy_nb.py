@@ -0,0 +1,214 @@
+'''
+Numba kernels for the EMA crossover strategy.
+
+Usage :
+from strategy.public.ema_strategy_nb import ema_cross_signals, make_ema_cross, ema_cross_sweep
+
+entries, exits = ema_cross_signals(close, fast_ema_period, slow_ema_period)
+
+# Same signals from a kernel specialized for one (fast, slow) pair
+entries, exits = make_ema_cross(fast_ema_period, slow_ema_period)(close)
+
+# Parameter sweep, entries/exits are shaped (pairs, time, symbols)
+entries, exits = ema_cross_sweep(close, fast_windows=[5, 10, 20], slow_windows=[50, 100, 200])
+'''
+import os
+import numpy as np
+
+# vectorbt and numba hang when the default cache dir is not writable, point it somewhere we own.
+# Anchored to the repo root so the location does not depend on the working directory
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(_ROOT_DIR, "database", "numba_cache"))
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Keep the module importable (the strategy registry imports every module in strategy.public),
+    # the kernels below then run as plain Python and callers should take the NUMBA_AVAILABLE=False path
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, inline='always')
+def ewm_mean_nb(x, alpha, out):
+    """
+    Same recursion as pandas `ewm(alpha=alpha, adjust=False).mean()` (min_periods=0, ignore_na=False)
+    for a single column, written into `out`.
+    """
+    old_wt_factor = 1.0 - alpha
+    weighted = x[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, x.shape[0]):
+        cur = x[i]
+        is_observation = cur == cur
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted
+
+
+@njit(cache=True, inline='always')
+def ema_cross_column_nb(fast_ema, slow_ema, entries, exits):
+    """
+    Crossover flags for a single column of fast/slow EMAs, written into `entries` and `exits`.
+    Comparisons against NaN are False, matching the pandas shift(1) behaviour.
+    """
+    for i in range(1, fast_ema.shape[0]):
+        prev_fast, prev_slow = fast_ema[i - 1], slow_ema[i - 1]
+        cur_fast, cur_slow = fast_ema[i], slow_ema[i]
+        entries[i] = cur_fast > cur_slow and prev_fast <= prev_slow
+        exits[i] = cur_fast < cur_slow and prev_fast >= prev_slow
+
+
+# Explicit signatures so float32 and float64 inputs each compile once instead of per call site
+@njit([
+    "UniTuple(b1[:, :], 2)(f4[:, :], i8, i8)",
+    "UniTuple(b1[:, :], 2)(f8[:, :], i8, i8)",
+], parallel=True, cache=True)
+def ema_cross_signals(close, fast, slow):
+    """
+    EMA crossover signals over a 2-D (time x symbols) close array.
+
+    Args:
+        close (np.ndarray): 2-D float32 or float64 array of closing prices, one column per symbol.
+        fast (int): Period for the fast EMA.
+        slow (int): Period for the slow EMA.
+
+    Returns:
+        Tuple of np.ndarray: entries, exits as boolean arrays shaped like `close`.
+    """
+    n_rows, n_cols = close.shape
+    entries = np.zeros((n_rows, n_cols), dtype=np.bool_)
+    exits = np.zeros((n_rows, n_cols), dtype=np.bool_)
+    if n_rows == 0:
+        return entries, exits
+
+    alpha_fast = 2.0 / (fast + 1.0)
+    alpha_slow = 2.0 / (slow + 1.0)
+
+    for j in prange(n_cols):
+        fast_ema = np.empty(n_rows, dtype=np.float64)
+        slow_ema = np.empty(n_rows, dtype=np.float64)
+        ewm_mean_nb(close[:, j], alpha_fast, fast_ema)
+        ewm_mean_nb(close[:, j], alpha_slow, slow_ema)
+        ema_cross_column_nb(fast_ema, slow_ema, entries[:, j], exits[:, j])
+
+    return entries, exits
+
+
+# (fast, slow) -> specialized kernel, compiled on first use
+_EMA_CROSS_KERNELS = {}
+
+def make_ema_cross(fast: int, slow: int):
+    """
+    Build (or fetch) an EMA crossover kernel with the smoothing factors of `fast` and `slow`
+    folded in as compile time constants.
+
+    Numba cannot cache closures to disk, so each pair compiles once per process. Worth it when
+    the same pair is evaluated repeatedly, use `ema_cross_signals` for one-off runs.
+
+    Args:
+        fast (int): Period for the fast EMA.
+        slow (int): Period for the slow EMA.
+
+    Returns:
+        Callable: kernel(close) -> (entries, exits), same contract as `ema_cross_signals`.
+    """
+    key = (int(fast), int(slow))
+    kernel = _EMA_CROSS_KERNELS.get(key)
+    if kernel is not None:
+        return kernel
+
+    alpha_fast = 2.0 / (key[0] + 1.0)
+    alpha_slow = 2.0 / (key[1] + 1.0)
+
+    @njit(parallel=True)
+    def kernel(close):
+        n_rows, n_cols = close.shape
+        entries = np.zeros((n_rows, n_cols), dtype=np.bool_)
+        exits = np.zeros((n_rows, n_cols), dtype=np.bool_)
+        if n_rows == 0:
+            return entries, exits
+
+        for j in prange(n_cols):
+            fast_ema = np.empty(n_rows, dtype=np.float64)
+            slow_ema = np.empty(n_rows, dtype=np.float64)
+            ewm_mean_nb(close[:, j], alpha_fast, fast_ema)
+            ewm_mean_nb(close[:, j], alpha_slow, slow_ema)
+            ema_cross_column_nb(fast_ema, slow_ema, entries[:, j], exits[:, j])
+
+        return entries, exits
+
+    _EMA_CROSS_KERNELS[key] = kernel
+    return kernel
+
+
+@njit(parallel=True, cache=True)
+def ewm_mean_windows_nb(close, alphas):
+    """
+    EMAs of every column of `close` for every smoothing factor in `alphas`, shaped (windows, time, symbols).
+    """
+    n_rows, n_cols = close.shape
+    n_windows = alphas.shape[0]
+    out = np.empty((n_windows, n_rows, n_cols), dtype=np.float64)
+    if n_rows == 0:
+        return out
+
+    for k in prange(n_windows * n_cols):
+        w = k // n_cols
+        j = k % n_cols
+        ewm_mean_nb(close[:, j], alphas[w], out[w, :, j])
+    return out
+
+
+@njit(parallel=True, cache=True)
+def ema_cross_pairs_nb(emas, fast_idx, slow_idx):
+    """
+    Crossover flags for every (fast_idx[p], slow_idx[p]) pair of precomputed EMAs, shaped (pairs, time, symbols).
+    """
+    _, n_rows, n_cols = emas.shape
+    n_pairs = fast_idx.shape[0]
+    entries = np.zeros((n_pairs, n_rows, n_cols), dtype=np.bool_)
+    exits = np.zeros((n_pairs, n_rows, n_cols), dtype=np.bool_)
+
+    for p in prange(n_pairs):
+        for j in range(n_cols):
+            ema_cross_column_nb(emas[fast_idx[p], :, j], emas[slow_idx[p], :, j], entries[p, :, j], exits[p, :, j])
+    return entries, exits
+
+
+def ema_cross_sweep(close, fast_windows, slow_windows):
+    """
+    EMA crossover signals for a sweep of (fast, slow) pairs. Every distinct window is smoothed
+    once and shared across all pairs that use it.
+
+    Args:
+        close (np.ndarray): 2-D float32 or float64 array of closing prices, one column per symbol.
+        fast_windows (Sequence[int]): Fast EMA period of each pair.
+        slow_windows (Sequence[int]): Slow EMA period of each pair, same length as `fast_windows`.
+
+    Returns:
+        Tuple of np.ndarray: entries, exits as boolean arrays shaped (pairs, time, symbols).
+    """
+    fast_windows = np.asarray(fast_windows, dtype=np.int64)
+    slow_windows = np.asarray(slow_windows, dtype=np.int64)
+    if fast_windows.shape != slow_windows.shape:
+        raise ValueError("fast_windows and slow_windows must have the same length.")
+
+    windows, inverse = np.unique(np.concatenate([fast_windows, slow_windows]), return_inverse=True)
+    emas = ewm_mean_windows_nb(close, 2.0 / (windows + 1.0))
+
+    n_pairs = fast_windows.shape[0]
+    return ema_cross_pairs_nb(emas, inverse[:n_pairs], inverse[n_pairs:])
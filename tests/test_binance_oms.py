@@ -0,0 +1,127 @@
+import pytest
+import threading
+import time
+from decimal import Decimal
+
+binance_oms = pytest.importorskip("OMS.binance_oms")
+import requests
+from binance.exceptions import BinanceAPIException
+
+def api_error(status_code, code=-1000, msg="error"):
+    return BinanceAPIException(None, status_code, f'{{"code": {code}, "msg": "{msg}"}}')
+
+def make_binance(step_size, tick_size):
+    binance = object.__new__(binance_oms.Binance)
+    binance._symbol_filters_lock = threading.Lock()
+    binance._set_symbol_filters([{
+        'symbol': 'BTCUSDT',
+        'filters': [
+            {'filterType': 'LOT_SIZE', 'stepSize': step_size},
+            {'filterType': 'PRICE_FILTER', 'tickSize': tick_size},
+            {'filterType': 'MIN_NOTIONAL', 'notional': '5'},
+        ],
+    }], time.time())
+    return binance
+
+@pytest.mark.parametrize("value, expected", [
+    ("0.00100000", 3),
+    ("0.10000000", 1),
+    ("1.00000000", 0),
+    ("1.0", 0),
+    ("1", 0),
+    ("10", 0),
+    ("0.00000001", 8),
+])
+def test_decimal_places(value, expected):
+    assert binance_oms._decimal_places(value) == expected
+
+def test_quantize_to_filters_rounds_down_exactly():
+    binance = make_binance("0.00100000", "0.10000000")
+    quantity, price = binance._quantize_to_filters("btcusdt", 0.0129, 20000.19)
+    assert quantity == Decimal("0.012")
+    assert price == Decimal("20000.1")
+
+def test_quantize_to_filters_without_price():
+    binance = make_binance("1", "0.01")
+    quantity, price = binance._quantize_to_filters("BTCUSDT", 7.9)
+    assert quantity == Decimal("7")
+    assert price is None
+
+def test_filter_strings_avoid_scientific_notation():
+    binance = make_binance("0.000001", "0.0000001")
+    quantity, price = binance._filter_strings("BTCUSDT", 0.0000051, 0.00000012)
+    assert quantity == "0.000005"
+    assert price == "0.0000001"
+
+def test_round_to_filters_price_rounded_to_zero_is_float():
+    binance = make_binance("0.001", "0.01")
+    _, price = binance._round_to_filters("BTCUSDT", 1.0, 0.001)
+    assert isinstance(price, float) and price == 0.0
+
+def test_with_retry_retries_transient_errors():
+    calls = []
+
+    @binance_oms.with_retry(max_attempts=3, base=0)
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise requests.exceptions.Timeout()
+        return "ok"
+
+    assert flaky() == "ok"
+    assert len(calls) == 3
+
+def test_with_retry_gives_up_after_max_attempts():
+    calls = []
+
+    @binance_oms.with_retry(max_attempts=2, base=0)
+    def always_busy():
+        calls.append(1)
+        raise api_error(503)
+
+    with pytest.raises(BinanceAPIException):
+        always_busy()
+    assert len(calls) == 2
+
+def test_with_retry_raises_other_errors_immediately():
+    calls = []
+
+    @binance_oms.with_retry(max_attempts=3, base=0)
+    def rejected():
+        calls.append(1)
+        raise api_error(400, -1013, "Filter failure: LOT_SIZE")
+
+    with pytest.raises(BinanceAPIException):
+        rejected()
+    assert len(calls) == 1
+
+def test_with_retry_async():
+    import asyncio
+    calls = []
+
+    @binance_oms.with_retry(max_attempts=3, base=0)
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 2:
+            raise api_error(429)
+        return "ok"
+
+    assert asyncio.run(flaky()) == "ok"
+    assert len(calls) == 2
+
+def test_order_retries_only_when_never_sent():
+    calls = []
+
+    @binance_oms.with_retry(max_attempts=3, base=0, retry_on=binance_oms._never_sent)
+    def place():
+        calls.append(1)
+        raise api_error(503)
+
+    # Execution status unknown, resending could place the order twice
+    with pytest.raises(BinanceAPIException):
+        place()
+    assert len(calls) == 1
+    assert binance_oms._never_sent(api_error(429))
+    assert binance_oms._outcome_unknown(api_error(503))
+    assert not binance_oms._outcome_unknown(api_error(400))
+    assert binance_oms._outcome_unknown(binance_oms.RequestStatusUnknown())
@@ -0,0 +1,138 @@
+import pytest
+import numpy as np
+import pandas as pd
+from strategy.public.ema_strategy_nb import ema_cross_signals, make_ema_cross, ema_cross_sweep
+
+def pandas_ema_cross(close, fast, slow):
+    fast_ema = close.ewm(span=fast, adjust=False).mean()
+    slow_ema = close.ewm(span=slow, adjust=False).mean()
+    entries = (fast_ema > slow_ema) & (fast_ema.shift(1) <= slow_ema.shift(1))
+    exits = (fast_ema < slow_ema) & (fast_ema.shift(1) >= slow_ema.shift(1))
+    return entries.values, exits.values
+
+def test_ema_cross_signals_matches_pandas():
+    rng = np.random.default_rng(42)
+    close = np.cumsum(rng.normal(size=(1000, 4)), axis=0) + 100
+    # Symbols listed later, gaps in the middle and delisted symbols
+    close[:50, 1] = np.nan
+    close[400:410, 2] = np.nan
+    close[-30:, 3] = np.nan
+
+    expected_entries, expected_exits = pandas_ema_cross(pd.DataFrame(close), 10, 100)
+    entries, exits = ema_cross_signals(np.ascontiguousarray(close), 10, 100)
+
+    assert entries.dtype == np.bool_
+    assert np.array_equal(entries, expected_entries)
+    assert np.array_equal(exits, expected_exits)
+    assert entries.any() and exits.any()
+
+def test_ema_cross_signals_empty():
+    entries, exits = ema_cross_signals(np.empty((0, 3)), 10, 100)
+    assert entries.shape == (0, 3)
+    assert exits.shape == (0, 3)
+
+def test_ema_cross_signals_float32():
+    rng = np.random.default_rng(7)
+    close = np.cumsum(rng.normal(size=(1000, 3)), axis=0) + 100
+
+    entries_64, exits_64 = ema_cross_signals(np.ascontiguousarray(close), 5, 50)
+    entries_32, exits_32 = ema_cross_signals(np.ascontiguousarray(close, dtype=np.float32), 5, 50)
+
+    assert entries_32.shape == entries_64.shape
+    # float32 may flip a crossover that sits right on the EMA tie
+    assert (entries_32 != entries_64).sum() <= 2
+    assert (exits_32 != exits_64).sum() <= 2
+
+def test_make_ema_cross_matches_generic_kernel():
+    rng = np.random.default_rng(3)
+    close = np.cumsum(rng.normal(size=(500, 3)), axis=0) + 100
+    close[:20, 0] = np.nan
+
+    kernel = make_ema_cross(10, 100)
+    assert make_ema_cross(10, 100) is kernel
+
+    entries, exits = kernel(np.ascontiguousarray(close))
+    expected_entries, expected_exits = ema_cross_signals(np.ascontiguousarray(close), 10, 100)
+    assert np.array_equal(entries, expected_entries)
+    assert np.array_equal(exits, expected_exits)
+
+def test_ema_cross_sweep_matches_single_runs():
+    rng = np.random.default_rng(5)
+    close = np.ascontiguousarray(np.cumsum(rng.normal(size=(800, 3)), axis=0) + 100)
+    fast_windows = [5, 5, 10, 20]
+    slow_windows = [50, 100, 100, 50]
+
+    entries, exits = ema_cross_sweep(close, fast_windows, slow_windows)
+    assert entries.shape == (4, 800, 3)
+
+    for p, (fast, slow) in enumerate(zip(fast_windows, slow_windows)):
+        expected_entries, expected_exits = ema_cross_signals(close, fast, slow)
+        assert np.array_equal(entries[p], expected_entries)
+        assert np.array_equal(exits[p], expected_exits)
+
+def test_ema_cross_sweep_rejects_mismatched_windows():
+    with pytest.raises(ValueError):
+        ema_cross_sweep(np.ones((10, 2)), [5, 10], [50])
+
+def test_lfilter_fallback_matches_pandas():
+    # ema_strategy imports the Numba kernels too, only the fallback path is exercised here
+    from strategy.public.ema_strategy import _ewm_mean_lfilter, _ema_cross_signals_lfilter
+
+    rng = np.random.default_rng(11)
+    close = np.cumsum(rng.normal(size=(1000, 4)), axis=0) + 100
+    close[:50, 1] = np.nan
+    close[400:410, 2] = np.nan
+    close[:, 3] = np.nan
+
+    expected = pd.DataFrame(close).ewm(span=10, adjust=False).mean().values
+    np.testing.assert_allclose(_ewm_mean_lfilter(close, 2.0 / 11.0), expected, rtol=1e-12, equal_nan=True)
+
+    expected_entries, expected_exits = pandas_ema_cross(pd.DataFrame(close), 10, 100)
+    entries, exits = _ema_cross_signals_lfilter(close, 10, 100)
+    assert np.array_equal(entries, expected_entries)
+    assert np.array_equal(exits, expected_exits)
+
+def test_ema_strategy_run_matches_pandas():
+    from strategy.public.EmaStrat import EMAStrategy
+
+    rng = np.random.default_rng(13)
+    timestamps = pd.date_range("2024-01-01", periods=600, freq="h")
+    ohlcv_data = {}
+    for k, symbol in enumerate(["BTCUSDT", "ETHUSDT", "SOLUSDT"]):
+        close = np.cumsum(rng.normal(size=600)) + 100
+        ohlcv_data[symbol] = pd.DataFrame({
+            "timestamp": timestamps, "open": close, "high": close, "low": close, "close": close, "volume": 1.0,
+        })
+    # Listed later and with missing candles, so its index differs from the others
+    ohlcv_data["SOLUSDT"] = ohlcv_data["SOLUSDT"].iloc[100:].drop(index=range(300, 320))
+
+    entries, exits, close_data, open_data = EMAStrategy(10, 100).run(ohlcv_data)
+
+    for symbol, df in ohlcv_data.items():
+        close = df.set_index("timestamp")["close"]
+        expected_entries, expected_exits = pandas_ema_cross(close.to_frame(), 10, 100)
+        assert np.array_equal(entries.loc[close.index, symbol].values, expected_entries[:, 0])
+        assert np.array_equal(exits.loc[close.index, symbol].values, expected_exits[:, 0])
+    assert entries.dtypes.eq(bool).all() and not entries["SOLUSDT"].iloc[:100].any()
+    assert close_data.shape == open_data.shape == entries.shape
+
+def test_ema_strategy_run_sweep_matches_run():
+    from strategy.public.EmaStrat import EMAStrategy
+
+    rng = np.random.default_rng(17)
+    timestamps = pd.date_range("2024-01-01", periods=400, freq="h")
+    ohlcv_data = {}
+    for symbol in ["BTCUSDT", "ETHUSDT"]:
+        close = np.cumsum(rng.normal(size=400)) + 100
+        ohlcv_data[symbol] = pd.DataFrame({
+            "timestamp": timestamps, "open": close, "high": close, "low": close, "close": close, "volume": 1.0,
+        })
+    ohlcv_data["ETHUSDT"] = ohlcv_data["ETHUSDT"].iloc[50:]
+
+    entries, exits, _, _ = EMAStrategy().run_sweep(ohlcv_data, [5, 20], [20, 50])
+    assert set(entries.columns.droplevel("symbol")) == {(5, 20), (5, 50), (20, 50)}
+
+    for fast, slow in [(5, 20), (20, 50)]:
+        expected_entries, expected_exits, _, _ = EMAStrategy(fast, slow).run(ohlcv_data)
+        assert entries[(fast, slow)].equals(expected_entries)
+        assert exits[(fast, slow)].equals(expected_exits)